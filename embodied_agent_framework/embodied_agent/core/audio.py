@@ -59,6 +59,7 @@ class AudioProcessor:
 
         # PyAudio instance
         self._audio: Optional[pyaudio.PyAudio] = None
+        self._initialized = False
         self._recording_stream: Optional[pyaudio.Stream] = None
         self._playback_stream: Optional[pyaudio.Stream] = None
 
@@ -93,6 +94,7 @@ class AudioProcessor:
             # Ensure save directory exists
             os.makedirs(self.save_directory, exist_ok=True)
 
+            self._initialized = True
             logger.info("Audio processor initialized successfully")
             return True
 
@@ -124,6 +126,7 @@ class AudioProcessor:
             if self._audio:
                 self._audio.terminate()
                 self._audio = None
+            self._initialized = False
 
             logger.info("Audio processor shutdown complete")
             return True
@@ -132,6 +135,11 @@ class AudioProcessor:
             logger.error(f"Error during audio processor shutdown: {e}")
             return False
 
+    @property
+    def is_initialized(self) -> bool:
+        """Whether initialize() succeeded and shutdown() has not been called since"""
+        return self._initialized
+
     def _list_audio_devices(self):
         """List available audio devices"""
         if not self._audio:
@@ -198,49 +206,102 @@ class AudioProcessor:
                 timestamp = int(time.time())
                 save_path = f"{self.save_directory}/record_{timestamp}.{self.audio_format}"
 
-            # Open recording stream
-            stream = self._audio.open(
-                format=self.audio_config.format,
-                channels=self.audio_config.channels,
-                rate=self.audio_config.sample_rate,
-                input=True,
-                input_device_index=self.audio_config.input_device_index,
-                frames_per_buffer=self.audio_config.chunk_size
-            )
+            frames = await self._capture_frames(duration)
 
-            frames = []
-            num_chunks = int(self.audio_config.sample_rate * duration / self.audio_config.chunk_size)
+            # Save recording
+            if self._save_audio_frames(frames, save_path):
+                logger.info(f"Recording saved to {save_path}")
+                return save_path
+            else:
+                logger.error("Failed to save recording")
+                return None
 
-            self._is_recording = True
+        except Exception as e:
+            logger.error(f"Error during fixed duration recording: {e}")
+            self._is_recording = False
+            return None
+
+    async def record_pcm(self, duration: float) -> Optional[bytes]:
+        """
+        Record audio for a fixed duration and keep it in memory
+
+        Args:
+            duration: Recording duration in seconds
+
+        Returns:
+            Optional[bytes]: Raw PCM data (see recording_size()) or None if failed
+        """
+        try:
+            if self._is_recording:
+                logger.warning("Recording already in progress")
+                return None
+
+            logger.info(f"Starting {duration}s in-memory recording")
+            return b''.join(await self._capture_frames(duration))
 
+        except Exception as e:
+            logger.error(f"Error during in-memory recording: {e}")
+            self._is_recording = False
+            return None
+
+    def recording_size(self, duration: float) -> int:
+        """
+        Number of PCM bytes a complete fixed-duration recording produces
+
+        Args:
+            duration: Recording duration in seconds
+
+        Returns:
+            int: Expected size in bytes
+        """
+        num_chunks = int(self.audio_config.sample_rate * duration / self.audio_config.chunk_size)
+        sample_width = pyaudio.get_sample_size(self.audio_config.format)
+        return num_chunks * self.audio_config.chunk_size * self.audio_config.channels * sample_width
+
+    async def _capture_frames(self, duration: float) -> list:
+        """
+        Read fixed-duration audio chunks from the input device
+
+        Args:
+            duration: Recording duration in seconds
+
+        Returns:
+            list: Recorded audio frames (shorter if stop_recording() was called)
+        """
+        # Open recording stream
+        stream = self._audio.open(
+            format=self.audio_config.format,
+            channels=self.audio_config.channels,
+            rate=self.audio_config.sample_rate,
+            input=True,
+            input_device_index=self.audio_config.input_device_index,
+            frames_per_buffer=self.audio_config.chunk_size
+        )
+
+        frames = []
+        num_chunks = int(self.audio_config.sample_rate * duration / self.audio_config.chunk_size)
+
+        self._is_recording = True
+
+        try:
             for _ in range(num_chunks):
                 if not self._is_recording:
                     break
 
-                data = stream.read(self.audio_config.chunk_size)
+                # Drop overflowed input instead of aborting the recording
+                data = stream.read(self.audio_config.chunk_size, exception_on_overflow=False)
                 frames.append(data)
 
                 # Small delay to prevent blocking
                 await asyncio.sleep(0.001)
-
+        finally:
             # Close stream
             stream.stop_stream()
             stream.close()
 
             self._is_recording = False
 
-            # Save recording
-            if self._save_audio_frames(frames, save_path):
-                logger.info(f"Recording saved to {save_path}")
-                return save_path
-            else:
-                logger.error("Failed to save recording")
-                return None
-
-        except Exception as e:
-            logger.error(f"Error during fixed duration recording: {e}")
-            self._is_recording = False
-            return None
+        return frames
 
     async def record_voice_activated(self, max_duration: float = 30.0, save_path: Optional[str] = None) -> Optional[str]:
         """
@@ -73,6 +73,7 @@ class MultiModalFusion:
         self.scene_history: List[SceneContext] = []
         self.current_context: Optional[SceneContext] = None
         self._fusion_active = False
+        self._first_cycle_done: Optional[asyncio.Event] = None
 
         # Object tracking
         self.tracked_objects: Dict[str, Dict[str, Any]] = {}
@@ -109,6 +110,13 @@ class MultiModalFusion:
         self.robot_controller = robot_controller
         logger.info("Robot controller connected to multimodal fusion")
 
+    @property
+    def first_cycle_done(self) -> asyncio.Event:
+        """Event set once the current fusion run has completed its first cycle"""
+        if self._first_cycle_done is None:
+            self._first_cycle_done = asyncio.Event()
+        return self._first_cycle_done
+
     async def start_fusion(self) -> bool:
         """
         Start multimodal fusion process
@@ -122,6 +130,8 @@ class MultiModalFusion:
                 return True
 
             self._fusion_active = True
+            # Created here so the event belongs to the running loop
+            self._first_cycle_done = asyncio.Event()
 
             # Start fusion loop
             asyncio.create_task(self._fusion_loop())
@@ -165,6 +175,8 @@ class MultiModalFusion:
                     self.current_context = context
                     self._update_scene_history(context)
 
+                self._first_cycle_done.set()
+
                 # Control fusion frequency
                 await asyncio.sleep(1.0 / self.fusion_frequency)
 
@@ -59,8 +59,8 @@ class RobotController:
             bool: True if initialization successful
         """
         try:
-            # Connect to hardware
-            if not await self.hardware.connect():
+            # Connect to hardware, reusing an existing connection
+            if not self.hardware.is_connected and not await self.hardware.connect():
                 logger.error("Failed to connect to robot hardware")
                 return False
 
@@ -5,7 +5,8 @@ Vision Processing Module - Handles camera input and computer vision tasks
 import asyncio
 import cv2
 import numpy as np
-from typing import Dict, Any, Optional, List, Tuple
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple, Union
 from PIL import Image
 import time
 from loguru import logger
@@ -13,6 +14,40 @@ from pydantic import BaseModel
 
 from ..utils.config import ConfigManager
 
+HSVBound = Union[Tuple[int, int, int], np.ndarray]
+
+# Kernel for the open/close noise filtering in color detection
+_MORPH_KERNEL = np.ones((5, 5), np.uint8)
+
+
+def _check_hsv_range(bound: np.ndarray) -> None:
+    """Reject HSV bounds that would wrap around when cast to uint8"""
+    if bound.size and (bound.min() < 0 or bound.max() > 255):
+        raise ValueError(f"HSV bound {bound.tolist()} out of range 0-255")
+
+
+@lru_cache(maxsize=64)
+def _hsv_bound_from_tuple(bound: Tuple[int, ...]) -> np.ndarray:
+    """Convert an HSV bound tuple to a read-only uint8 array (cached)"""
+    _check_hsv_range(np.asarray(bound))
+    array = np.asarray(bound, dtype=np.uint8)
+    array.flags.writeable = False
+    return array
+
+
+def _as_hsv_bound(bound: HSVBound) -> np.ndarray:
+    """Return an HSV bound as a uint8 array ready for cv2.inRange
+
+    Raises:
+        ValueError: If any component is outside 0-255
+    """
+    if isinstance(bound, np.ndarray):
+        if bound.dtype == np.uint8:
+            return bound
+        _check_hsv_range(bound)
+        return bound.astype(np.uint8)
+    return _hsv_bound_from_tuple(tuple(bound))
+
 
 class BoundingBox(BaseModel):
     """Bounding box representation"""
@@ -62,6 +97,7 @@ class VisionProcessor:
 
         # Camera instance
         self._camera: Optional[cv2.VideoCapture] = None
+        self._initialized = False
         self._is_streaming = False
         self._current_frame: Optional[np.ndarray] = None
 
@@ -99,6 +135,7 @@ class VisionProcessor:
                 return False
 
             self._current_frame = frame
+            self._initialized = True
             logger.info(f"Vision processor initialized with camera {self.camera_index}")
             logger.info(f"Camera resolution: {frame.shape[1]}x{frame.shape[0]}")
 
@@ -121,6 +158,7 @@ class VisionProcessor:
             if self._camera:
                 self._camera.release()
                 self._camera = None
+            self._initialized = False
 
             cv2.destroyAllWindows()
             logger.info("Vision processor shutdown complete")
@@ -242,6 +280,11 @@ class VisionProcessor:
         finally:
             self._is_streaming = False
 
+    @property
+    def is_initialized(self) -> bool:
+        """Whether initialize() succeeded and the camera is still open"""
+        return self._initialized
+
     def get_current_frame(self) -> Optional[np.ndarray]:
         """
         Get the current camera frame
@@ -251,13 +294,15 @@ class VisionProcessor:
         """
         return self._current_frame.copy() if self._current_frame is not None else None
 
-    async def detect_objects_color(self, color_ranges: Dict[str, Dict[str, Tuple[int, int, int]]]) -> DetectionResult:
+    async def detect_objects_color(self, color_ranges: Dict[str, Dict[str, HSVBound]]) -> DetectionResult:
         """
         Detect objects based on color ranges
 
         Args:
             color_ranges: Dictionary mapping object names to HSV color ranges
                          e.g., {'red_block': {'lower': (0, 50, 50), 'upper': (10, 255, 255)}}
+                         Bounds may also be uint8 numpy arrays, which are used as-is;
+                         components outside 0-255 are rejected, not wrapped
 
         Returns:
             DetectionResult: Detection results
@@ -273,16 +318,15 @@ class VisionProcessor:
             objects = []
 
             for object_name, color_range in color_ranges.items():
-                lower = np.array(color_range['lower'])
-                upper = np.array(color_range['upper'])
+                lower = _as_hsv_bound(color_range['lower'])
+                upper = _as_hsv_bound(color_range['upper'])
 
                 # Create mask
                 mask = cv2.inRange(hsv, lower, upper)
 
                 # Morphological operations to reduce noise
-                kernel = np.ones((5, 5), np.uint8)
-                mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-                mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+                mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, _MORPH_KERNEL)
+                mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, _MORPH_KERNEL)
 
                 # Find contours
                 contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -75,6 +75,11 @@ class RobotHardwareInterface(ABC):
             self._capabilities = self.get_capabilities()
         return self._capabilities
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether the hardware is connected and usable"""
+        return self.state in (RobotState.CONNECTED, RobotState.MOVING, RobotState.IDLE)
+
     @abstractmethod
     async def connect(self) -> bool:
         """
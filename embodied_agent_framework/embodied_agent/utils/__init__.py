@@ -4,10 +4,11 @@ Utility modules for the Embodied Agent Framework
 
 from .calibration import HandEyeCalibration
 from .motion_planning import MotionPlanner
-from .config import ConfigManager
+from .config import ConfigManager, get_config_manager
 
 __all__ = [
     "HandEyeCalibration",
     "MotionPlanner",
     "ConfigManager",
+    "get_config_manager",
 ]
\ No newline at end of file
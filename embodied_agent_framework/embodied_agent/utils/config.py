@@ -3,13 +3,223 @@ Configuration Management utilities
 """
 
 import os
+import re
 import yaml
 import json
-from typing import Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from pathlib import Path
 from loguru import logger
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+# Maximum number of configurations kept in the in-memory cache
+_CONFIG_CACHE_SIZE = 100
+
+# Stamp used for configurations whose file does not exist
+_MISSING_STAMP = (-1, -1)
+
+# Shared empty read-only mapping for missing sections
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# ${ENV_VAR} or ${ENV_VAR:default} placeholders
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+# Environment variables validate_config requires
+_REQUIRED_ENV_VARS = (
+    'PRIVATE_API_KEY', 'PRIVATE_BASE_URL',
+    'PRIVATE_LLM_MODEL', 'PRIVATE_VLM_MODEL'
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze, returning a mutable deep copy"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Default file contents are frozen so no caller can change them for the whole
+# process; save_config thaws them into plain dicts when writing
+
+# Default contents of config.yaml
+_MAIN_DEFAULT = _freeze({
+    'framework': {
+        'name': 'EmbodiedAgent Framework',
+        'version': '0.1.0',
+        'log_level': 'INFO',
+        'temp_directory': 'temp',
+        'assets_directory': 'assets'
+    },
+    'fusion': {
+        'context_window': 5.0,
+        'confidence_threshold': 0.7,
+        'fusion_frequency': 10.0,
+        'object_persistence_time': 3.0
+    },
+    'safety': {
+        'max_speed': 50,
+        'safe_height': 200,
+        'workspace_limits': {
+            'x': [-250, 250],
+            'y': [-250, 250],
+            'z': [50, 350]
+        },
+        'emergency_stop_enabled': True
+    }
+})
+
+# Default contents of hardware.yaml
+_HARDWARE_DEFAULT = _freeze({
+    'robot': {
+        'type': 'mycobot',
+        'port': '${ROBOT_PORT:/dev/ttyUSB0}',
+        'baudrate': 115200,
+        'simulation_mode': False,
+        'suction_pin_1': 20,
+        'suction_pin_2': 21,
+        'default_speed': 40,
+        'safe_height': 230
+    },
+    'camera': {
+        'camera_index': 0,
+        'resolution': [640, 480],
+        'fps': 30,
+        'auto_exposure': True,
+        'brightness': 0,
+        'contrast': 1.0,
+        'save_directory': 'temp',
+        'image_format': 'jpg'
+    },
+    'audio': {
+        'sample_rate': 16000,
+        'channels': 1,
+        'chunk_size': 1024,
+        'input_device_index': None,
+        'output_device_index': None,
+        'recording_duration': 5,
+        'voice_activation_threshold': 0.01,
+        'silence_duration': 2.0,
+        'save_directory': 'temp',
+        'audio_format': 'wav'
+    }
+})
+
+# Default contents of models.yaml
+_MODELS_DEFAULT = _freeze({
+    'llm': {
+        'default_provider': 'private',
+        'providers': {
+            'openai': {
+                'api_key': '${OPENAI_API_KEY}',
+                'base_url': 'https://api.openai.com/v1',
+                'model_name': 'gpt-4',
+                'temperature': 0.7,
+                'max_tokens': 1000
+            },
+            'yi': {
+                'api_key': '${YI_KEY}',
+                'base_url': 'https://api.lingyiwanwu.com/v1',
+                'model_name': 'yi-large',
+                'temperature': 0.7,
+                'max_tokens': 1000
+            },
+            'private': {
+                'api_key': '${PRIVATE_API_KEY}',
+                'base_url': '${PRIVATE_BASE_URL}',
+                'model_name': '${PRIVATE_LLM_MODEL}',
+                'temperature': 0.7,
+                'max_tokens': 1000
+            }
+        }
+    },
+    'vlm': {
+        'default_provider': 'private',
+        'providers': {
+            'yi_vision': {
+                'api_key': '${YI_KEY}',
+                'base_url': 'https://api.lingyiwanwu.com/v1',
+                'model_name': 'yi-vision',
+                'temperature': 0.7,
+                'max_tokens': 1000
+            },
+            'qwen_vl': {
+                'api_key': '${QWEN_KEY}',
+                'base_url': 'https://dashscope.aliyuncs.com/compatible-mode/v1',
+                'model_name': 'qwen-vl-max-2024-11-19',
+                'temperature': 0.7,
+                'max_tokens': 1000
+            },
+            'private': {
+                'api_key': '${PRIVATE_API_KEY}',
+                'base_url': '${PRIVATE_BASE_URL}',
+                'model_name': '${PRIVATE_VLM_MODEL}',
+                'temperature': 0.7,
+                'max_tokens': 1000
+            }
+        }
+    },
+    'tts': {
+        'provider': 'appbuilder',
+        'api_key': '${APPBUILDER_TOKEN}',
+        'voice': 'zh-CN-XiaoxiaoNeural'
+    },
+    'asr': {
+        'provider': 'appbuilder',
+        'api_key': '${APPBUILDER_TOKEN}',
+        'language': 'zh-CN'
+    }
+})
+
+# Contents of .env.example
+_ENV_TEMPLATE = """# Embodied Agent Framework Environment Variables
+# Copy this file to .env and fill in your API keys
+
+# OpenAI API Key
+OPENAI_API_KEY=your_openai_api_key_here
+
+# Yi (零一万物) API Key
+YI_KEY=your_yi_api_key_here
+
+# Qwen (通义千问) API Key
+QWEN_KEY=your_qwen_api_key_here
+
+# AppBuilder Token (for TTS/ASR)
+APPBUILDER_TOKEN=your_appbuilder_token_here
+
+# Private Model Configuration
+PRIVATE_API_KEY=your_private_api_key_here
+PRIVATE_BASE_URL=http://localhost:8000/v1
+PRIVATE_LLM_MODEL=your_text_model_name
+PRIVATE_VLM_MODEL=your_vision_model_name
+
+# Hardware Configuration
+ROBOT_PORT=/dev/ttyUSB0
+
+# Development Settings
+DEBUG=false
+LOG_LEVEL=INFO
+"""
+
 
 class ConfigManager:
     """
@@ -27,50 +237,209 @@ class ConfigManager:
         self.config_dir.mkdir(exist_ok=True)
 
         # Load environment variables
+        self._load_env()
+
+        # Configuration cache: name -> (mtime_ns, size, frozen config), LRU ordered
+        self._config_cache: "OrderedDict[str, Tuple[int, int, Mapping[str, Any]]]" = OrderedDict()
+
+        # Sections handed out by the get_*_config getters:
+        # (config_name, section) -> (source config view, section config)
+        self._section_cache: Dict[Tuple[str, str], Tuple[Mapping[str, Any], Mapping[str, Any]]] = {}
+
+        # Provider configs from models.yaml, keyed by requested provider (None = default):
+        # provider -> (source llm/vlm section, provider config)
+        self._llm_provider_cache: Dict[Optional[str], Tuple[Mapping[str, Any], Mapping[str, Any]]] = {}
+        self._vlm_provider_cache: Dict[Optional[str], Tuple[Mapping[str, Any], Mapping[str, Any]]] = {}
+
+        # Last validate_config result: (config views, env values, results)
+        self._validation_cache: Optional[Tuple[Tuple[Mapping[str, Any], ...],
+                                               Tuple[Optional[str], ...],
+                                               Dict[str, bool]]] = None
+
+        # Guards cache updates from concurrent save_config calls
+        self._cache_lock = threading.RLock()
+
+    def _load_env(self, override: bool = False):
+        """Load environment variables from the .env file, if present"""
         env_file = self.config_dir / ".env"
         if env_file.exists():
-            load_dotenv(env_file)
-            logger.info(f"Loaded environment variables from {env_file}")
+            load_dotenv(env_file, override=override)
+            logger.debug("Loaded environment variables from {}", env_file)
 
-        # Configuration cache
-        self._config_cache: Dict[str, Any] = {}
+    def reload_env(self):
+        """
+        Re-read the .env file and drop cached configurations
 
-    def load_config(self, config_name: str, default: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        Values from .env override the current environment, and cached
+        configurations are discarded because their ${ENV_VAR} placeholders
+        were resolved with the previous values.
+        """
+        self._load_env(override=True)
+        self._reset_caches()
+
+    def _reset_caches(self):
+        """Clear all cached configurations and derived sections"""
+        with self._cache_lock:
+            self._config_cache.clear()
+            self._section_cache.clear()
+            self._llm_provider_cache.clear()
+            self._vlm_provider_cache.clear()
+            self._validation_cache = None
+
+    def load_config(self, config_name: str, default: Optional[Dict[str, Any]] = None,
+                    writable: bool = False) -> Mapping[str, Any]:
         """
         Load configuration from YAML file
 
+        The cached configuration is shared, so it is returned as a read-only
+        view (nested mappings and tuples). Pass ``writable=True`` to get a
+        mutable deep copy, e.g. to edit and pass it back to save_config.
+
         Args:
             config_name: Name of configuration file (without extension)
             default: Default configuration if file doesn't exist
+            writable: Return a mutable copy instead of the read-only view
 
         Returns:
-            Dict[str, Any]: Configuration dictionary
+            Mapping[str, Any]: Configuration mapping
         """
-        if config_name in self._config_cache:
-            return self._config_cache[config_name]
-
         config_file = self.config_dir / f"{config_name}.yaml"
 
         try:
-            if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f) or {}
-                logger.info(f"Loaded configuration from {config_file}")
+            try:
+                st = config_file.stat()
+                stamp = (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                st = None
+                stamp = _MISSING_STAMP
+
+            # A missing file resolves to the caller's default, which may differ
+            # between calls, so only the file contents (or no default) are cached
+            cacheable = st is not None or default is None
+
+            # Warm path: return the cached view without logging
+            with self._cache_lock:
+                cached = self._config_cache.get(config_name)
+                if cacheable and cached is not None and cached[:2] == stamp:
+                    self._config_cache.move_to_end(config_name)
+                    view = cached[2]
+                else:
+                    view = None
+            if view is not None:
+                return _thaw(view) if writable else view
+
+            if st is not None:
+                config, needs_resolve = self._load_yaml_cached(config_name, config_file, st)
+                logger.debug("Loaded configuration from {}", config_file)
             else:
-                config = default or {}
+                config, needs_resolve = _thaw(default) if default else {}, True
                 logger.warning(f"Configuration file {config_file} not found, using defaults")
 
             # Replace environment variable placeholders
-            config = self._resolve_env_vars(config)
+            if needs_resolve:
+                config = self._resolve_env_vars(config)
 
-            self._config_cache[config_name] = config
-            return config
+            config = _freeze(config)
+            if cacheable:
+                self._cache_config(config_name, stamp, config)
+            return _thaw(config) if writable else config
 
         except Exception as e:
             logger.error(f"Error loading configuration {config_name}: {e}")
-            return default or {}
+            config = _freeze(_thaw(default) if default else {})
+            return _thaw(config) if writable else config
+
+    def _cache_config(self, config_name: str, stamp: Tuple[int, int], config: Mapping[str, Any]):
+        """Insert a configuration into the LRU cache, evicting the oldest entries"""
+        with self._cache_lock:
+            self._config_cache[config_name] = (stamp[0], stamp[1], config)
+            self._config_cache.move_to_end(config_name)
+            while len(self._config_cache) > _CONFIG_CACHE_SIZE:
+                self._config_cache.popitem(last=False)
+
+    def _get_section(self, config_name: str, section: str) -> Mapping[str, Any]:
+        """
+        Get a top-level section of a configuration
+
+        The section is reused while load_config keeps returning the same
+        cached view, and recomputed once the file has changed on disk.
+
+        Args:
+            config_name: Name of configuration file (without extension)
+            section: Top-level key within the configuration
+
+        Returns:
+            Mapping[str, Any]: Read-only section configuration
+        """
+        key = (config_name, section)
+        source = self.load_config(config_name)
+        cached = self._section_cache.get(key)
+        if cached is None or cached[0] is not source:
+            cached = (source, source.get(section, _EMPTY))
+            self._section_cache[key] = cached
+        return cached[1]
+
+    def _invalidate_sections(self, config_name: str):
+        """Drop getter sections derived from the given configuration"""
+        with self._cache_lock:
+            for key in [key for key in self._section_cache if key[0] == config_name]:
+                del self._section_cache[key]
+            if config_name == 'models':
+                self._llm_provider_cache.clear()
+                self._vlm_provider_cache.clear()
+
+    def _load_yaml_cached(self, config_name: str, config_file: Path,
+                          st: os.stat_result) -> Tuple[Dict[str, Any], bool]:
+        """
+        Load a YAML file through its JSON sidecar cache
+
+        The sidecar ``.<name>.cache.json`` holds a header line with the YAML
+        file's ``(mtime_ns, size)`` followed by the parsed content. It is used
+        only when the header matches the YAML file, otherwise the YAML is
+        parsed and the sidecar rewritten. Content that JSON cannot represent
+        exactly (non-string keys, dates, ...) is never written to the sidecar.
+
+        Args:
+            config_name: Name of configuration file (without extension)
+            config_file: Path to the YAML file
+            st: Stat result of the YAML file
+
+        Returns:
+            Tuple[Dict[str, Any], bool]: Parsed (unresolved) configuration and
+            whether it contains any ``${`` placeholder
+        """
+        header = {'_mtime': st.st_mtime_ns, '_size': st.st_size}
+        cache_path = self.config_dir / f".{config_name}.cache.json"
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                if json.loads(f.readline()) == header:
+                    body = f.read()
+                    return json.loads(body), '${' in body
+        except (OSError, ValueError):
+            pass
+
+        data = config_file.read_bytes()
+        config = yaml.load(data, Loader=_Loader) or {}
+
+        try:
+            body = json.dumps(config, ensure_ascii=False)
+            # JSON turns non-string keys into strings and cannot hold dates,
+            # sets, etc.; only cache content that reads back unchanged
+            if json.loads(body) != config:
+                logger.debug("Config {} does not round-trip through JSON, not caching it", config_name)
+            else:
+                tmp_path = cache_path.with_suffix('.tmp')
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps(header) + '\n')
+                    f.write(body)
+                os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not write config cache {}: {}", cache_path, e)
+
+        return config, b'${' in data
 
-    def save_config(self, config_name: str, config: Dict[str, Any]) -> bool:
+    def save_config(self, config_name: str, config: Mapping[str, Any]) -> bool:
         """
         Save configuration to YAML file
 
@@ -84,10 +453,21 @@ class ConfigManager:
         try:
             config_file = self.config_dir / f"{config_name}.yaml"
 
+            # Accept read-only views from load_config as well as plain dicts
+            config = _thaw(config)
+            content = yaml.dump(config, Dumper=_Dumper, default_flow_style=False,
+                                allow_unicode=True, sort_keys=False, width=1000)
             with open(config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
+                f.write(content)
 
-            self._config_cache[config_name] = config
+            if '${' in content:
+                cached = _freeze(self._resolve_env_vars(config))
+            else:
+                cached = _freeze(config)
+
+            self._invalidate_sections(config_name)
+            st = config_file.stat()
+            self._cache_config(config_name, (st.st_mtime_ns, st.st_size), cached)
             logger.info(f"Saved configuration to {config_file}")
             return True
 
@@ -124,8 +504,8 @@ class ConfigManager:
             return [self._resolve_env_vars(item) for item in config]
         elif isinstance(config, str):
             # Replace ${ENV_VAR} or ${ENV_VAR:default} patterns
-            import re
-            pattern = r'\$\{([^}]+)\}'
+            if '${' not in config:
+                return config
 
             def replace_env_var(match):
                 env_expr = match.group(1)
@@ -135,222 +515,80 @@ class ConfigManager:
                 else:
                     return os.getenv(env_expr.strip(), match.group(0))
 
-            return re.sub(pattern, replace_env_var, config)
+            return _ENV_VAR_RE.sub(replace_env_var, config)
         else:
             return config
 
     def create_default_configs(self):
         """Create default configuration files"""
-        self._create_main_config()
-        self._create_hardware_config()
-        self._create_models_config()
-        self._create_env_template()
+        # Each writer targets its own file, so they can run concurrently
+        writers = [
+            self._create_main_config,
+            self._create_hardware_config,
+            self._create_models_config,
+            self._create_env_template,
+        ]
+        with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+            list(executor.map(lambda write: write(), writers))
 
     def _create_main_config(self):
         """Create main configuration file"""
-        config = {
-            'framework': {
-                'name': 'EmbodiedAgent Framework',
-                'version': '0.1.0',
-                'log_level': 'INFO',
-                'temp_directory': 'temp',
-                'assets_directory': 'assets'
-            },
-            'fusion': {
-                'context_window': 5.0,
-                'confidence_threshold': 0.7,
-                'fusion_frequency': 10.0,
-                'object_persistence_time': 3.0
-            },
-            'safety': {
-                'max_speed': 50,
-                'safe_height': 200,
-                'workspace_limits': {
-                    'x': [-250, 250],
-                    'y': [-250, 250],
-                    'z': [50, 350]
-                },
-                'emergency_stop_enabled': True
-            }
-        }
-        self.save_config('config', config)
+        self.save_config('config', _MAIN_DEFAULT)
 
     def _create_hardware_config(self):
         """Create hardware configuration file"""
-        config = {
-            'robot': {
-                'type': 'mycobot',
-                'port': '${ROBOT_PORT:/dev/ttyUSB0}',
-                'baudrate': 115200,
-                'simulation_mode': False,
-                'suction_pin_1': 20,
-                'suction_pin_2': 21,
-                'default_speed': 40,
-                'safe_height': 230
-            },
-            'camera': {
-                'camera_index': 0,
-                'resolution': [640, 480],
-                'fps': 30,
-                'auto_exposure': True,
-                'brightness': 0,
-                'contrast': 1.0,
-                'save_directory': 'temp',
-                'image_format': 'jpg'
-            },
-            'audio': {
-                'sample_rate': 16000,
-                'channels': 1,
-                'chunk_size': 1024,
-                'input_device_index': null,
-                'output_device_index': null,
-                'recording_duration': 5,
-                'voice_activation_threshold': 0.01,
-                'silence_duration': 2.0,
-                'save_directory': 'temp',
-                'audio_format': 'wav'
-            }
-        }
-        self.save_config('hardware', config)
+        self.save_config('hardware', _HARDWARE_DEFAULT)
 
     def _create_models_config(self):
         """Create models configuration file"""
-        config = {
-            'llm': {
-                'default_provider': 'private',
-                'providers': {
-                    'openai': {
-                        'api_key': '${OPENAI_API_KEY}',
-                        'base_url': 'https://api.openai.com/v1',
-                        'model_name': 'gpt-4',
-                        'temperature': 0.7,
-                        'max_tokens': 1000
-                    },
-                    'yi': {
-                        'api_key': '${YI_KEY}',
-                        'base_url': 'https://api.lingyiwanwu.com/v1',
-                        'model_name': 'yi-large',
-                        'temperature': 0.7,
-                        'max_tokens': 1000
-                    },
-                    'private': {
-                        'api_key': '${PRIVATE_API_KEY}',
-                        'base_url': '${PRIVATE_BASE_URL}',
-                        'model_name': '${PRIVATE_LLM_MODEL}',
-                        'temperature': 0.7,
-                        'max_tokens': 1000
-                    }
-                }
-            },
-            'vlm': {
-                'default_provider': 'private',
-                'providers': {
-                    'yi_vision': {
-                        'api_key': '${YI_KEY}',
-                        'base_url': 'https://api.lingyiwanwu.com/v1',
-                        'model_name': 'yi-vision',
-                        'temperature': 0.7,
-                        'max_tokens': 1000
-                    },
-                    'qwen_vl': {
-                        'api_key': '${QWEN_KEY}',
-                        'base_url': 'https://dashscope.aliyuncs.com/compatible-mode/v1',
-                        'model_name': 'qwen-vl-max-2024-11-19',
-                        'temperature': 0.7,
-                        'max_tokens': 1000
-                    },
-                    'private': {
-                        'api_key': '${PRIVATE_API_KEY}',
-                        'base_url': '${PRIVATE_BASE_URL}',
-                        'model_name': '${PRIVATE_VLM_MODEL}',
-                        'temperature': 0.7,
-                        'max_tokens': 1000
-                    }
-                }
-            },
-            'tts': {
-                'provider': 'appbuilder',
-                'api_key': '${APPBUILDER_TOKEN}',
-                'voice': 'zh-CN-XiaoxiaoNeural'
-            },
-            'asr': {
-                'provider': 'appbuilder',
-                'api_key': '${APPBUILDER_TOKEN}',
-                'language': 'zh-CN'
-            }
-        }
-        self.save_config('models', config)
+        self.save_config('models', _MODELS_DEFAULT)
 
     def _create_env_template(self):
         """Create environment variables template file"""
-        env_content = """# Embodied Agent Framework Environment Variables
-# Copy this file to .env and fill in your API keys
-
-# OpenAI API Key
-OPENAI_API_KEY=your_openai_api_key_here
-
-# Yi (零一万物) API Key
-YI_KEY=your_yi_api_key_here
-
-# Qwen (通义千问) API Key
-QWEN_KEY=your_qwen_api_key_here
-
-# AppBuilder Token (for TTS/ASR)
-APPBUILDER_TOKEN=your_appbuilder_token_here
-
-# Private Model Configuration
-PRIVATE_API_KEY=your_private_api_key_here
-PRIVATE_BASE_URL=http://localhost:8000/v1
-PRIVATE_LLM_MODEL=your_text_model_name
-PRIVATE_VLM_MODEL=your_vision_model_name
-
-# Hardware Configuration
-ROBOT_PORT=/dev/ttyUSB0
-
-# Development Settings
-DEBUG=false
-LOG_LEVEL=INFO
-"""
         env_file = self.config_dir / ".env.example"
-        with open(env_file, 'w', encoding='utf-8') as f:
-            f.write(env_content)
+        env_file.write_text(_ENV_TEMPLATE, encoding='utf-8')
         logger.info(f"Created environment template at {env_file}")
 
-    def get_robot_config(self) -> Dict[str, Any]:
+    def get_robot_config(self) -> Mapping[str, Any]:
         """Get robot hardware configuration"""
-        hardware_config = self.load_config('hardware')
-        return hardware_config.get('robot', {})
+        return self._get_section('hardware', 'robot')
 
-    def get_camera_config(self) -> Dict[str, Any]:
+    def get_camera_config(self) -> Mapping[str, Any]:
         """Get camera configuration"""
-        hardware_config = self.load_config('hardware')
-        return hardware_config.get('camera', {})
+        return self._get_section('hardware', 'camera')
 
-    def get_audio_config(self) -> Dict[str, Any]:
+    def get_audio_config(self) -> Mapping[str, Any]:
         """Get audio configuration"""
-        hardware_config = self.load_config('hardware')
-        return hardware_config.get('audio', {})
+        return self._get_section('hardware', 'audio')
 
-    def get_llm_config(self, provider: Optional[str] = None) -> Dict[str, Any]:
+    def get_llm_config(self, provider: Optional[str] = None) -> Mapping[str, Any]:
         """Get LLM configuration"""
-        models_config = self.load_config('models')
-        llm_config = models_config.get('llm', {})
+        llm_config = self._get_section('models', 'llm')
+
+        # Reuse the entry while the llm section is unchanged
+        cached = self._llm_provider_cache.get(provider)
+        if cached is not None and cached[0] is llm_config:
+            return cached[1]
 
-        if provider is None:
-            provider = llm_config.get('default_provider', 'openai')
+        name = provider if provider is not None else llm_config.get('default_provider', 'openai')
 
-        provider_config = llm_config.get('providers', {}).get(provider, {})
+        provider_config = llm_config.get('providers', _EMPTY).get(name, _EMPTY)
+        self._llm_provider_cache[provider] = (llm_config, provider_config)
         return provider_config
 
-    def get_vlm_config(self, provider: Optional[str] = None) -> Dict[str, Any]:
+    def get_vlm_config(self, provider: Optional[str] = None) -> Mapping[str, Any]:
         """Get VLM configuration"""
-        models_config = self.load_config('models')
-        vlm_config = models_config.get('vlm', {})
+        vlm_config = self._get_section('models', 'vlm')
 
-        if provider is None:
-            provider = vlm_config.get('default_provider', 'yi_vision')
+        # Reuse the entry while the vlm section is unchanged
+        cached = self._vlm_provider_cache.get(provider)
+        if cached is not None and cached[0] is vlm_config:
+            return cached[1]
 
-        provider_config = vlm_config.get('providers', {}).get(provider, {})
+        name = provider if provider is not None else vlm_config.get('default_provider', 'yi_vision')
+
+        provider_config = vlm_config.get('providers', _EMPTY).get(name, _EMPTY)
+        self._vlm_provider_cache[provider] = (vlm_config, provider_config)
         return provider_config
 
     def validate_config(self) -> Dict[str, bool]:
@@ -360,14 +598,27 @@ LOG_LEVEL=INFO
         Returns:
             Dict[str, bool]: Validation results
         """
+        configs = (
+            self.load_config('config'),
+            self.load_config('hardware'),
+            self.load_config('models'),
+        )
+        env_values = tuple(os.getenv(var) for var in _REQUIRED_ENV_VARS)
+
+        # load_config returns the same cached view until a file changes, so
+        # identical views and env values mean the last result still holds
+        cached = self._validation_cache
+        if (cached is not None and cached[1] == env_values
+                and all(old is new for old, new in zip(cached[0], configs))):
+            return dict(cached[2])
+
+        main_config, hardware_config, models_config = configs
         results = {}
 
         # Check main config
-        main_config = self.load_config('config')
         results['main_config'] = bool(main_config.get('framework'))
 
         # Check hardware config
-        hardware_config = self.load_config('hardware')
         results['hardware_config'] = bool(
             hardware_config.get('robot') and
             hardware_config.get('camera') and
@@ -375,19 +626,27 @@ LOG_LEVEL=INFO
         )
 
         # Check models config
-        models_config = self.load_config('models')
         results['models_config'] = bool(
             models_config.get('llm') and
             models_config.get('vlm')
         )
 
         # Check environment variables
-        required_env_vars = [
-            'PRIVATE_API_KEY', 'PRIVATE_BASE_URL',
-            'PRIVATE_LLM_MODEL', 'PRIVATE_VLM_MODEL'
-        ]
-        results['env_variables'] = all(
-            os.getenv(var) for var in required_env_vars
-        )
+        results['env_variables'] = all(env_values)
+
+        self._validation_cache = (configs, env_values, results)
+        return dict(results)
+
 
-        return results
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_config_manager(config_dir: str = "config") -> ConfigManager:
+    """
+    Get the shared configuration manager for a config directory
+
+    Args:
+        config_dir: Directory containing configuration files
+
+    Returns:
+        ConfigManager: Process-wide manager instance
+    """
+    return ConfigManager(config_dir)
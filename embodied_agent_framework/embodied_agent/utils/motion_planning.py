@@ -2,12 +2,65 @@
 Motion Planning utilities for safe robot movement
 """
 
+import math
 from typing import List, Tuple, Dict, Any, Optional
 import numpy as np
 from loguru import logger
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed: run the plain Python function"""
+        return lambda func: func
+
 from ..interfaces.robot_hardware import CartesianPosition
 
+# Pose fields in the column order used by (N, 6) waypoint arrays
+_POSE_FIELDS = ('x', 'y', 'z', 'rx', 'ry', 'rz')
+
+
+def _pose_array(position: CartesianPosition) -> np.ndarray:
+    """Convert a position to a (6,) float array"""
+    return np.array([position.x, position.y, position.z,
+                     position.rx, position.ry, position.rz], dtype=np.float64)
+
+
+def _to_positions(points: np.ndarray) -> List[CartesianPosition]:
+    """Convert an (N, 6) waypoint array to positions"""
+    return [CartesianPosition(**dict(zip(_POSE_FIELDS, row))) for row in points.tolist()]
+
+
+@njit(cache=True, fastmath=True)
+def _traj_time(seg: np.ndarray, two_accel_distance: float, trapezoid_offset: float,
+               inv_amax: float, inv_vmax: float) -> float:
+    """
+    Estimate execution time of a path with a trapezoidal velocity profile
+
+    Args:
+        seg: (N-1,) array of segment lengths in mm
+        two_accel_distance: Distance covered while accelerating and decelerating
+        trapezoid_offset: Constant part of the trapezoidal segment time
+        inv_amax: 1 / maximum acceleration
+        inv_vmax: 1 / maximum velocity
+
+    Returns:
+        float: Estimated execution time in seconds
+    """
+    total_time = 0.0
+    for distance in seg:
+        if distance <= two_accel_distance:
+            # Triangular profile (short distance)
+            total_time += 2.0 * math.sqrt(distance * inv_amax)
+        else:
+            # Trapezoidal profile
+            total_time += trapezoid_offset + distance * inv_vmax
+
+    return total_time
+
 
 class MotionPlanner:
     """
@@ -29,16 +82,46 @@ class MotionPlanner:
         self.path_resolution = config.get('path_resolution', 10)  # mm
         self.safe_height = config.get('safe_height', 200)  # mm
 
+        # Trapezoidal velocity profile constants
+        self._accel_time = self.max_velocity / self.max_acceleration
+        self._accel_distance = 0.5 * self.max_acceleration * self._accel_time**2
+        self._two_accel_dist = 2.0 * self._accel_distance
+        self._inv_amax = 1.0 / self.max_acceleration
+        self._inv_vmax = 1.0 / self.max_velocity
+        # 2 * accel_time + (distance - 2 * accel_distance) / vmax == offset + distance / vmax
+        self._trapezoid_offset = 2.0 * self._accel_time - self._two_accel_dist * self._inv_vmax
+
         # Workspace limits
         self.workspace_limits = config.get('workspace_limits', {
             'x': (-250, 250),
             'y': (-250, 250),
             'z': (50, 350)
         })
+        # Lower/upper x, y, z bounds as arrays for vectorized limit checks
+        self._ws_lo = np.array([self.workspace_limits[axis][0] for axis in 'xyz'], dtype=np.float64)
+        self._ws_hi = np.array([self.workspace_limits[axis][1] for axis in 'xyz'], dtype=np.float64)
 
         # Obstacles (simplified as spheres for now)
         self.obstacles = config.get('obstacles', [])
 
+        # Obstacle centers (K, 3) and squared radii (K,) for vectorized collision checks
+        centers, radii_sq = [], []
+        for obstacle in self.obstacles:
+            try:
+                center = np.asarray(obstacle['center'], dtype=np.float64)  # [x, y, z]
+                radius = float(obstacle['radius'])
+                if center.ndim != 1 or len(center) < 3:
+                    raise ValueError(f"center needs x, y, z, got {obstacle['center']!r}")
+            except (KeyError, TypeError, ValueError) as e:
+                # Skip malformed obstacles instead of failing planner construction
+                logger.warning(f"Invalid obstacle definition {obstacle!r}: {e}")
+                continue
+            centers.append(center[:3])
+            # A negative radius never collides
+            radii_sq.append(radius * radius if radius >= 0 else -1.0)
+        self._obs_centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+        self._obs_r2 = np.asarray(radii_sq, dtype=np.float64)
+
     def plan_trajectory(self, start: CartesianPosition,
                        goal: CartesianPosition,
                        use_safe_height: bool = True) -> List[CartesianPosition]:
@@ -113,38 +196,27 @@ class MotionPlanner:
         Returns:
             List[CartesianPosition]: Trajectory waypoints
         """
-        waypoints = []
+        start_pose = _pose_array(start)
+        goal_pose = _pose_array(goal)
 
         # Calculate distance
-        distance = np.sqrt((goal.x - start.x)**2 + (goal.y - start.y)**2 + (goal.z - start.z)**2)
+        distance = float(np.linalg.norm(goal_pose[:3] - start_pose[:3]))
 
         # Number of intermediate waypoints
         num_waypoints = max(2, int(distance / self.path_resolution))
 
-        # Generate intermediate waypoints
-        for i in range(num_waypoints + 1):
-            t = i / num_waypoints
+        # Linear interpolation of position and orientation, one row per waypoint
+        ts = np.linspace(0.0, 1.0, num_waypoints + 1)
+        points = start_pose + ts[:, None] * (goal_pose - start_pose)
 
-            # Linear interpolation
-            x = start.x + t * (goal.x - start.x)
-            y = start.y + t * (goal.y - start.y)
-            z = start.z + t * (goal.z - start.z)
+        # Check for collisions
+        valid = self._valid_mask(points[:, :3])
+        if not valid.all():
+            i = int(np.argmin(valid))
+            logger.warning(f"Collision detected at waypoint {i}, using safe height approach")
+            return self._plan_safe_height_trajectory(start, goal)
 
-            # Interpolate orientation
-            rx = start.rx + t * (goal.rx - start.rx)
-            ry = start.ry + t * (goal.ry - start.ry)
-            rz = start.rz + t * (goal.rz - start.rz)
-
-            waypoint = CartesianPosition(x=x, y=y, z=z, rx=rx, ry=ry, rz=rz)
-
-            # Check for collisions
-            if self.is_position_valid(waypoint):
-                waypoints.append(waypoint)
-            else:
-                logger.warning(f"Collision detected at waypoint {i}, using safe height approach")
-                return self._plan_safe_height_trajectory(start, goal)
-
-        return waypoints
+        return _to_positions(points)
 
     def is_position_valid(self, position: CartesianPosition) -> bool:
         """
@@ -166,6 +238,19 @@ class MotionPlanner:
 
         return True
 
+    def _valid_mask(self, points: np.ndarray) -> np.ndarray:
+        """
+        Batch counterpart of is_position_valid
+
+        Args:
+            points: (N, 3) array of x, y, z coordinates
+
+        Returns:
+            np.ndarray: (N,) bool array, True where the position is valid
+        """
+        in_workspace = np.all((points >= self._ws_lo) & (points <= self._ws_hi), axis=1)
+        return in_workspace & self._is_collision_free_batch(points)
+
     def _is_within_workspace(self, position: CartesianPosition) -> bool:
         """
         Check if position is within workspace limits
@@ -176,13 +261,8 @@ class MotionPlanner:
         Returns:
             bool: True if within workspace
         """
-        x_min, x_max = self.workspace_limits['x']
-        y_min, y_max = self.workspace_limits['y']
-        z_min, z_max = self.workspace_limits['z']
-
-        return (x_min <= position.x <= x_max and
-                y_min <= position.y <= y_max and
-                z_min <= position.z <= z_max)
+        p = np.array([position.x, position.y, position.z], dtype=np.float64)
+        return bool(np.all((p >= self._ws_lo) & (p <= self._ws_hi)))
 
     def _is_collision_free(self, position: CartesianPosition) -> bool:
         """
@@ -194,37 +274,28 @@ class MotionPlanner:
         Returns:
             bool: True if collision-free
         """
-        for obstacle in self.obstacles:
-            if self._check_sphere_collision(position, obstacle):
-                return False
+        if not len(self._obs_r2):
+            return True
 
-        return True
+        p = np.array([position.x, position.y, position.z], dtype=np.float64)
+        d2 = ((self._obs_centers - p)**2).sum(axis=1)
+        return not np.any(d2 <= self._obs_r2)
 
-    def _check_sphere_collision(self, position: CartesianPosition,
-                              obstacle: Dict[str, Any]) -> bool:
+    def _is_collision_free_batch(self, points: np.ndarray) -> np.ndarray:
         """
-        Check collision with spherical obstacle
+        Check a batch of positions against all obstacles
 
         Args:
-            position: Position to check
-            obstacle: Obstacle definition with 'center' and 'radius'
+            points: (N, 3) array of x, y, z coordinates
 
         Returns:
-            bool: True if collision detected
+            np.ndarray: (N,) bool array, True where collision-free
         """
-        try:
-            center = obstacle['center']  # [x, y, z]
-            radius = obstacle['radius']
+        if not len(self._obs_r2):
+            return np.ones(len(points), dtype=bool)
 
-            distance = np.sqrt((position.x - center[0])**2 +
-                             (position.y - center[1])**2 +
-                             (position.z - center[2])**2)
-
-            return distance <= radius
-
-        except KeyError:
-            logger.warning("Invalid obstacle definition")
-            return False
+        d2 = ((points[:, None, :] - self._obs_centers[None, :, :])**2).sum(axis=-1)
+        return (d2 > self._obs_r2).all(axis=1)
 
     def smooth_trajectory(self, waypoints: List[CartesianPosition],
                          smoothing_factor: float = 0.1) -> List[CartesianPosition]:
@@ -242,37 +313,23 @@ class MotionPlanner:
             return waypoints
 
         try:
-            smoothed = [waypoints[0]]  # Keep first waypoint
-
-            for i in range(1, len(waypoints) - 1):
-                prev_wp = waypoints[i - 1]
-                curr_wp = waypoints[i]
-                next_wp = waypoints[i + 1]
-
-                # Apply smoothing
-                smooth_x = curr_wp.x + smoothing_factor * (
-                    (prev_wp.x + next_wp.x) / 2 - curr_wp.x
-                )
-                smooth_y = curr_wp.y + smoothing_factor * (
-                    (prev_wp.y + next_wp.y) / 2 - curr_wp.y
-                )
-                smooth_z = curr_wp.z + smoothing_factor * (
-                    (prev_wp.z + next_wp.z) / 2 - curr_wp.z
-                )
-
-                smoothed_wp = CartesianPosition(
-                    x=smooth_x, y=smooth_y, z=smooth_z,
-                    rx=curr_wp.rx, ry=curr_wp.ry, rz=curr_wp.rz
-                )
-
-                # Validate smoothed waypoint
-                if self.is_position_valid(smoothed_wp):
-                    smoothed.append(smoothed_wp)
-                else:
-                    smoothed.append(curr_wp)  # Keep original if invalid
-
-            smoothed.append(waypoints[-1])  # Keep last waypoint
-            return smoothed
+            points = np.array([_pose_array(w) for w in waypoints])
+            smoothed = points.copy()
+
+            # Three-point filter on x, y, z of interior waypoints; orientation is kept
+            xyz = points[:, :3]
+            mid = (xyz[:-2] + xyz[2:]) / 2
+            smoothed[1:-1, :3] = xyz[1:-1] + smoothing_factor * (mid - xyz[1:-1])
+
+            # Validate smoothed waypoints, keeping the original where invalid
+            valid = self._valid_mask(smoothed[1:-1, :3])
+            accepted = iter(_to_positions(smoothed[1:-1][valid]))
+
+            result = [waypoints[0]]  # Keep first waypoint
+            result.extend(next(accepted) if is_valid else waypoint
+                          for is_valid, waypoint in zip(valid.tolist(), waypoints[1:-1]))
+            result.append(waypoints[-1])  # Keep last waypoint
+            return result
 
         except Exception as e:
             logger.error(f"Error smoothing trajectory: {e}")
@@ -291,29 +348,7 @@ class MotionPlanner:
         if len(waypoints) < 2:
             return 0.0
 
-        total_time = 0.0
-
-        for i in range(1, len(waypoints)):
-            prev_wp = waypoints[i - 1]
-            curr_wp = waypoints[i]
-
-            # Calculate distance
-            distance = np.sqrt((curr_wp.x - prev_wp.x)**2 +
-                             (curr_wp.y - prev_wp.y)**2 +
-                             (curr_wp.z - prev_wp.z)**2)
-
-            # Estimate time based on max velocity and acceleration
-            # Simplified trapezoidal velocity profile
-            accel_time = self.max_velocity / self.max_acceleration
-            accel_distance = 0.5 * self.max_acceleration * accel_time**2
-
-            if distance <= 2 * accel_distance:
-                # Triangular profile (short distance)
-                total_time += 2 * np.sqrt(distance / self.max_acceleration)
-            else:
-                # Trapezoidal profile
-                cruise_distance = distance - 2 * accel_distance
-                cruise_time = cruise_distance / self.max_velocity
-                total_time += 2 * accel_time + cruise_time
-
-        return total_time
\ No newline at end of file
+        xyz = np.array([[w.x, w.y, w.z] for w in waypoints], dtype=np.float64)
+        seg = np.linalg.norm(np.diff(xyz, axis=0), axis=1)
+        return float(_traj_time(seg, self._two_accel_dist, self._trapezoid_offset,
+                                self._inv_amax, self._inv_vmax))
@@ -7,16 +7,17 @@ Quick Start Script - 快速启动脚本
 import sys
 import os
 import asyncio
+import threading
 from pathlib import Path
-from loguru import logger
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
 
+# 必需的环境变量
+REQUIRED_ENV = (
+    'PRIVATE_API_KEY', 'PRIVATE_BASE_URL',
+    'PRIVATE_LLM_MODEL', 'PRIVATE_VLM_MODEL'
+)
 
-def print_banner():
-    """打印启动横幅"""
-    banner = """
+BANNER = """
     ╔══════════════════════════════════════════════════════════════╗
     ║                                                              ║
     ║     🤖 具身智能体框架 (Embodied Agent Framework)             ║
@@ -24,13 +25,10 @@ def print_banner():
     ║     一个标准化的机械臂+AI大模型+多模态感知的开发框架           ║
     ║                                                              ║
     ╚══════════════════════════════════════════════════════════════╝
-    """
-    print(banner)
 
+"""
 
-def print_menu():
-    """打印主菜单"""
-    menu = """
+MENU = """
     请选择您要执行的操作:
 
     📋 配置和设置:
@@ -41,6 +39,7 @@ def print_menu():
       3. 完整系统测试         - 测试所有组件的功能和连通性
       4. 模型连通性测试       - 测试AI模型API连接
       5. 硬件设备测试         - 测试机械臂、摄像头、音频设备
+     10. 运行全部测试         - 并发测试模型和硬件，再运行系统测试
 
     🚀 应用示例:
       6. 运行AI学伴演示       - 启动AI学习助手应用
@@ -52,129 +51,10 @@ def print_menu():
 
       0. 退出程序
 
-    """
-    print(menu)
-
-
-async def run_config_setup():
-    """运行配置设置"""
-    print("🔧 启动配置设置助手...")
-    try:
-        from setup_config import ConfigSetup
-        setup = ConfigSetup()
-        setup.run_setup()
-    except Exception as e:
-        print(f"❌ 配置设置失败: {e}")
-
-
-async def show_current_config():
-    """显示当前配置"""
-    print("📋 当前配置信息:")
-    print("-" * 50)
-
-    try:
-        from embodied_agent.utils.config import ConfigManager
-        config_manager = ConfigManager()
-
-        # 显示配置验证结果
-        validation_results = config_manager.validate_config()
-        print("\n配置状态:")
-        for check_name, result in validation_results.items():
-            status_icon = "✅" if result else "❌"
-            print(f"  {status_icon} {check_name.replace('_', ' ').title()}")
-
-        # 显示主要配置
-        print("\n主要配置:")
-        main_config = config_manager.load_config('config')
-        if main_config:
-            print(f"  - 框架版本: {main_config.get('framework', {}).get('version', 'unknown')}")
-            print(f"  - 日志级别: {main_config.get('framework', {}).get('log_level', 'INFO')}")
-
-        # 显示模型配置
-        models_config = config_manager.load_config('models')
-        if models_config:
-            llm_provider = models_config.get('llm', {}).get('default_provider', 'unknown')
-            vlm_provider = models_config.get('vlm', {}).get('default_provider', 'unknown')
-            print(f"  - 默认LLM提供商: {llm_provider}")
-            print(f"  - 默认VLM提供商: {vlm_provider}")
-
-        # 显示环境变量状态
-        print("\n环境变量状态:")
-        required_vars = [
-            'PRIVATE_API_KEY', 'PRIVATE_BASE_URL',
-            'PRIVATE_LLM_MODEL', 'PRIVATE_VLM_MODEL'
-        ]
-        for var in required_vars:
-            value = os.getenv(var)
-            status = "✅ 已设置" if value else "❌ 未设置"
-            print(f"  - {var}: {status}")
-
-    except Exception as e:
-        print(f"❌ 读取配置失败: {e}")
-
-
-async def run_system_test():
-    """运行完整系统测试"""
-    print("🧪 启动完整系统测试...")
-    try:
-        from tests.test_system import main as test_main
-        await test_main()
-    except Exception as e:
-        print(f"❌ 系统测试失败: {e}")
-
-
-async def run_model_test():
-    """运行模型连通性测试"""
-    print("🧠 启动模型连通性测试...")
-    try:
-        from tests.test_models import main as test_main
-        await test_main()
-    except Exception as e:
-        print(f"❌ 模型测试失败: {e}")
-
-
-async def run_hardware_test():
-    """运行硬件设备测试"""
-    print("🔧 启动硬件设备测试...")
-    try:
-        from tests.test_hardware import main as test_main
-        await test_main()
-    except Exception as e:
-        print(f"❌ 硬件测试失败: {e}")
-
-
-async def run_ai_tutor_demo():
-    """运行AI学伴演示"""
-    print("🎓 启动AI学伴演示...")
-    print("⚠️ AI学伴应用还在开发中，敬请期待！")
-    # TODO: 实现AI学伴应用
-
-
-async def run_basic_demo():
-    """运行基础功能演示"""
-    print("🤖 启动基础功能演示...")
-
-    try:
-        # 检查是否有原项目的演示代码
-        demo_path = Path("../agent_demo_20250328/agent_go.py")
-        if demo_path.exists():
-            print("找到原项目演示代码，是否运行原版演示？(y/n): ", end="")
-            response = input().strip().lower()
-            if response in ['y', 'yes', '是']:
-                print("请在原项目目录中运行: python agent_go.py")
-                return
-
-        print("运行框架基础功能演示...")
-        # TODO: 实现基础功能演示
-        print("⚠️ 基础功能演示还在开发中，请先运行测试脚本验证功能！")
-
-    except Exception as e:
-        print(f"❌ 演示运行失败: {e}")
 
+"""
 
-def show_usage_guide():
-    """显示使用说明"""
-    guide = """
+GUIDE = """
     ══════════════════════════════════════════════════════════════
                               使用说明
     ══════════════════════════════════════════════════════════════
@@ -220,13 +100,10 @@ def show_usage_guide():
     - 树莓派环境需要sudo权限运行GPIO相关功能
 
     ══════════════════════════════════════════════════════════════
-    """
-    print(guide)
 
+"""
 
-def show_api_docs():
-    """显示API文档"""
-    docs = """
+DOCS = """
     ══════════════════════════════════════════════════════════════
                               API文档
     ══════════════════════════════════════════════════════════════
@@ -314,8 +191,233 @@ def show_api_docs():
     ```
 
     ══════════════════════════════════════════════════════════════
+
+"""
+
+# 大段帮助文本预先编码，输出时一次写入
+GUIDE_BYTES = GUIDE.encode('utf-8')
+DOCS_BYTES = DOCS.encode('utf-8')
+
+
+def write_bytes(data: bytes, text: str):
+    """直接写入stdout底层缓冲区；stdout不支持字节写入或非UTF-8编码时退回文本写入"""
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None or (sys.stdout.encoding or '').lower().replace('-', '') != 'utf8':
+        sys.stdout.write(text)
+        return
+    # 先刷新文本层，保证与之前print的输出顺序一致
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _resolve_input(future: asyncio.Future, result: str = None, error: BaseException = None):
+    """在事件循环线程中设置 ainput 的结果（等待方已取消时忽略）"""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+async def ainput(prompt: str = "") -> str:
+    """
+    在守护线程中读取输入，避免阻塞事件循环
+
+    不使用默认线程池：Ctrl+C 取消等待后，asyncio.run 退出时会等待线程池中
+    仍阻塞在 input() 的线程，程序会卡到按下回车为止；守护线程不会阻止退出。
     """
-    print(docs)
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def read():
+        try:
+            result, error = input(prompt), None
+        except BaseException as e:  # EOFError 等
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(_resolve_input, future, result, error)
+        except RuntimeError:
+            pass  # 事件循环已关闭
+
+    threading.Thread(target=read, name="ainput", daemon=True).start()
+    return await future
+
+
+def print_banner():
+    """打印启动横幅"""
+    sys.stdout.write(BANNER)
+
+
+def print_menu():
+    """打印主菜单"""
+    sys.stdout.write(MENU)
+
+
+async def run_config_setup():
+    """运行配置设置"""
+    print("🔧 启动配置设置助手...")
+    try:
+        from setup_config import ConfigSetup
+        setup = ConfigSetup()
+        setup.run_setup()
+    except Exception as e:
+        print(f"❌ 配置设置失败: {e}")
+
+
+async def show_current_config():
+    """显示当前配置"""
+    print("📋 当前配置信息:")
+    print("-" * 50)
+
+    try:
+        from embodied_agent.utils.config import get_config_manager
+        config_manager = get_config_manager()
+
+        # 显示配置验证结果
+        validation_results = config_manager.validate_config()
+        print("\n配置状态:")
+        for check_name, result in validation_results.items():
+            status_icon = "✅" if result else "❌"
+            print(f"  {status_icon} {check_name.replace('_', ' ').title()}")
+
+        # 显示主要配置
+        print("\n主要配置:")
+        main_config = config_manager.load_config('config')
+        if main_config:
+            print(f"  - 框架版本: {main_config.get('framework', {}).get('version', 'unknown')}")
+            print(f"  - 日志级别: {main_config.get('framework', {}).get('log_level', 'INFO')}")
+
+        # 显示模型配置
+        models_config = config_manager.load_config('models')
+        if models_config:
+            llm_provider = models_config.get('llm', {}).get('default_provider', 'unknown')
+            vlm_provider = models_config.get('vlm', {}).get('default_provider', 'unknown')
+            print(f"  - 默认LLM提供商: {llm_provider}")
+            print(f"  - 默认VLM提供商: {vlm_provider}")
+
+        # 显示环境变量状态
+        print("\n环境变量状态:")
+        env = dict(os.environ)
+        for var in REQUIRED_ENV:
+            value = env.get(var)
+            status = "✅ 已设置" if value else "❌ 未设置"
+            print(f"  - {var}: {status}")
+
+    except Exception as e:
+        print(f"❌ 读取配置失败: {e}")
+
+
+async def run_system_test():
+    """运行完整系统测试"""
+    print("🧪 启动完整系统测试...")
+    try:
+        from tests.test_system import main as test_main
+        await test_main()
+    except Exception as e:
+        print(f"❌ 系统测试失败: {e}")
+
+
+async def run_model_test():
+    """运行模型连通性测试"""
+    print("🧠 启动模型连通性测试...")
+    try:
+        from tests.test_models import main as test_main
+        await test_main()
+    except Exception as e:
+        print(f"❌ 模型测试失败: {e}")
+
+
+async def run_hardware_test():
+    """运行硬件设备测试"""
+    print("🔧 启动硬件设备测试...")
+    try:
+        from tests.test_hardware import main as test_main
+        await test_main()
+    except Exception as e:
+        print(f"❌ 硬件测试失败: {e}")
+
+
+async def run_all_tests():
+    """运行全部测试：模型和硬件测试并发运行，系统测试随后单独运行"""
+    print("🧪 运行全部测试...")
+    try:
+        from tests.test_system import main as system_main
+        from tests.test_models import main as models_main
+        from tests.test_hardware import main as hardware_main
+    except Exception as e:
+        print(f"❌ 加载测试失败: {e}")
+        return
+
+    # 模型测试只访问网络，硬件测试只访问本地设备，两者可以并发
+    results = await asyncio.gather(
+        models_main(), hardware_main(),
+        return_exceptions=True
+    )
+
+    # 系统测试会重写 config/*.yaml 并打开同样的串口、摄像头和麦克风，必须单独运行
+    try:
+        results.append(await system_main())
+    except Exception as e:
+        results.append(e)
+
+    for test_name, result in zip(["模型测试", "硬件测试", "系统测试"], results):
+        if isinstance(result, BaseException):
+            print(f"❌ {test_name}失败: {result}")
+
+
+async def run_ai_tutor_demo():
+    """运行AI学伴演示"""
+    print("🎓 启动AI学伴演示...")
+    print("⚠️ AI学伴应用还在开发中，敬请期待！")
+    # TODO: 实现AI学伴应用
+
+
+async def run_basic_demo():
+    """运行基础功能演示"""
+    print("🤖 启动基础功能演示...")
+
+    try:
+        # 检查是否有原项目的演示代码
+        demo_path = Path("../agent_demo_20250328/agent_go.py")
+        if demo_path.exists():
+            response = (await ainput("找到原项目演示代码，是否运行原版演示？(y/n): ")).strip().lower()
+            if response in ['y', 'yes', '是']:
+                print("请在原项目目录中运行: python agent_go.py")
+                return
+
+        print("运行框架基础功能演示...")
+        # TODO: 实现基础功能演示
+        print("⚠️ 基础功能演示还在开发中，请先运行测试脚本验证功能！")
+
+    except Exception as e:
+        print(f"❌ 演示运行失败: {e}")
+
+
+def show_usage_guide():
+    """显示使用说明"""
+    write_bytes(GUIDE_BYTES, GUIDE)
+
+
+def show_api_docs():
+    """显示API文档"""
+    write_bytes(DOCS_BYTES, DOCS)
+
+
+# 菜单选项 -> (处理函数, 是否为协程函数)
+HANDLERS = {
+    "1": (run_config_setup, True),
+    "2": (show_current_config, True),
+    "3": (run_system_test, True),
+    "4": (run_model_test, True),
+    "5": (run_hardware_test, True),
+    "6": (run_ai_tutor_demo, True),
+    "7": (run_basic_demo, True),
+    "8": (show_usage_guide, False),
+    "9": (show_api_docs, False),
+    "10": (run_all_tests, True),
+}
 
 
 async def main_menu():
@@ -324,41 +426,30 @@ async def main_menu():
         print_menu()
 
         try:
-            choice = input("请输入选项编号 (0-9): ").strip()
+            choice = (await ainput("请输入选项编号 (0-10): ")).strip()
 
             if choice == "0":
                 print("👋 感谢使用具身智能体框架！")
                 break
-            elif choice == "1":
-                await run_config_setup()
-            elif choice == "2":
-                await show_current_config()
-            elif choice == "3":
-                await run_system_test()
-            elif choice == "4":
-                await run_model_test()
-            elif choice == "5":
-                await run_hardware_test()
-            elif choice == "6":
-                await run_ai_tutor_demo()
-            elif choice == "7":
-                await run_basic_demo()
-            elif choice == "8":
-                show_usage_guide()
-            elif choice == "9":
-                show_api_docs()
+
+            handler, is_async = HANDLERS.get(choice, (None, False))
+            if handler is None:
+                print("❌ 无效选项，请输入 0-10 之间的数字")
+            elif is_async:
+                await handler()
             else:
-                print("❌ 无效选项，请输入 0-9 之间的数字")
+                handler()
 
-            input("\n按回车键继续...")
+            await ainput("\n按回车键继续...")
             print("\n" + "="*60 + "\n")
 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Ctrl+C 时 asyncio.run 会取消主任务，等待中的 ainput 收到 CancelledError
             print("\n\n👋 感谢使用具身智能体框架！")
             break
         except Exception as e:
             print(f"\n❌ 操作失败: {e}")
-            input("按回车键继续...")
+            await ainput("按回车键继续...")
 
 
 async def main():
@@ -370,12 +461,21 @@ async def main():
         print("❌ 需要Python 3.8或更高版本")
         sys.exit(1)
 
-    # 创建必要的目录
-    for directory in ['config', 'tests', 'temp', 'logs']:
-        Path(directory).mkdir(exist_ok=True)
+    # 创建必要的目录（首次运行后由标记文件跳过）
+    init_marker = Path('config/.initialized')
+    if not init_marker.exists():
+        for directory in ['config', 'tests', 'temp', 'logs']:
+            Path(directory).mkdir(exist_ok=True)
+        init_marker.touch()
 
     await main_menu()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        # uvloop is optional (not available on Windows)
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file
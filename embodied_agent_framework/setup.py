@@ -50,6 +50,9 @@ setup(
             "sphinx>=4.0",
             "sphinx-rtd-theme>=1.0",
         ],
+        "speed": [
+            "numba>=0.57",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -6,15 +6,54 @@ Configuration Setup Script - 配置设置助手
 
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
-import inquirer
-from loguru import logger
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
 
-from embodied_agent.utils.config import ConfigManager
+# .env文件中的变量分组（按写入顺序）
+ENV_GROUPS = (
+    ("Private Model Configuration", (
+        'PRIVATE_API_KEY', 'PRIVATE_BASE_URL',
+        'PRIVATE_LLM_MODEL', 'PRIVATE_VLM_MODEL'
+    )),
+    ("Online Model APIs", (
+        'YI_KEY', 'QWEN_KEY', 'OPENAI_API_KEY', 'APPBUILDER_TOKEN'
+    )),
+    ("Hardware Configuration", (
+        'ROBOT_PORT',
+    )),
+    ("Development Settings", (
+        'DEBUG', 'LOG_LEVEL'
+    )),
+)
+
+# 可选的在线模型API: (环境变量, 确认问题, 输入提示)
+ONLINE_API_KEYS = (
+    ('YI_KEY', "是否配置零一万物(Yi)模型API？", "请输入零一万物API密钥"),
+    ('QWEN_KEY', "是否配置通义千问(Qwen)模型API？", "请输入通义千问API密钥"),
+    ('OPENAI_API_KEY', "是否配置OpenAI模型API？", "请输入OpenAI API密钥"),
+    ('APPBUILDER_TOKEN', "是否配置百度AppBuilder（用于TTS/ASR）？", "请输入AppBuilder Token"),
+)
+
+
+def _load_inquirer():
+    """延迟导入inquirer（可选依赖），不可用时返回None"""
+    try:
+        import inquirer
+    except ImportError:
+        return None
+    return inquirer
+
+
+def _required(_answers, value) -> bool:
+    """inquirer校验：必填项不能为空"""
+    return bool(value.strip())
+
+
+def _optional_index(_answers, value) -> bool:
+    """inquirer校验：留空或为数字"""
+    return not value or value.isdigit()
 
 
 class ConfigSetup:
@@ -22,8 +61,13 @@ class ConfigSetup:
 
     def __init__(self):
         """初始化配置设置"""
-        self.config_manager = ConfigManager()
+        # 延迟导入，避免启动时加载配置模块
+        from embodied_agent.utils.config import get_config_manager
+
+        self.config_manager = get_config_manager()
         self.env_vars = {}
+        # inquirer可用时按组批量提问，否则逐项使用input()
+        self.inquirer = _load_inquirer()
 
     def run_setup(self):
         """运行配置设置流程"""
@@ -57,6 +101,12 @@ class ConfigSetup:
         """创建默认配置文件"""
         print("📁 创建默认配置文件...")
 
+        # 配置文件已存在时跳过，避免重复写入（也不会覆盖用户修改）
+        config_dir = self.config_manager.config_dir
+        if all((config_dir / f"{name}.yaml").exists() for name in ('config', 'hardware', 'models')):
+            print("✅ 默认配置文件已存在")
+            return
+
         try:
             self.config_manager.create_default_configs()
             print("✅ 默认配置文件创建成功")
@@ -69,6 +119,10 @@ class ConfigSetup:
         print("\n🔑 设置API密钥")
         print("-" * 30)
 
+        if self.inquirer is not None:
+            self._prompt_api_keys()
+            return
+
         # 私有化模型配置（必需）
         print("\n📍 私有化模型配置 (必需)")
         self.env_vars['PRIVATE_API_KEY'] = self._get_input(
@@ -96,57 +150,93 @@ class ConfigSetup:
         # 在线模型配置（可选）
         print("\n🌐 在线模型配置 (可选)")
 
-        if self._ask_yes_no("是否配置零一万物(Yi)模型API？"):
-            self.env_vars['YI_KEY'] = self._get_input(
-                "请输入零一万物API密钥",
-                secret=True
-            )
+        for var, question, prompt in ONLINE_API_KEYS:
+            if self._ask_yes_no(question):
+                self.env_vars[var] = self._get_input(prompt, secret=True)
 
-        if self._ask_yes_no("是否配置通义千问(Qwen)模型API？"):
-            self.env_vars['QWEN_KEY'] = self._get_input(
-                "请输入通义千问API密钥",
-                secret=True
-            )
+    def _prompt_api_keys(self):
+        """使用inquirer按组批量设置API密钥"""
+        inquirer = self.inquirer
 
-        if self._ask_yes_no("是否配置OpenAI模型API？"):
-            self.env_vars['OPENAI_API_KEY'] = self._get_input(
-                "请输入OpenAI API密钥",
-                secret=True
-            )
+        print("\n📍 私有化模型配置 (必需)")
+        answers = self._prompt([
+            inquirer.Password('PRIVATE_API_KEY', message="请输入私有模型API密钥", validate=_required),
+            inquirer.Text('PRIVATE_BASE_URL', message="请输入私有模型服务地址",
+                          default="http://localhost:8000/v1", validate=_required),
+            inquirer.Text('PRIVATE_LLM_MODEL', message="请输入文本模型名称", validate=_required),
+            inquirer.Text('PRIVATE_VLM_MODEL', message="请输入视觉模型名称", validate=_required),
+        ])
+        self.env_vars.update((name, value.strip()) for name, value in answers.items())
 
-        if self._ask_yes_no("是否配置百度AppBuilder（用于TTS/ASR）？"):
-            self.env_vars['APPBUILDER_TOKEN'] = self._get_input(
-                "请输入AppBuilder Token",
-                secret=True
-            )
+        print("\n🌐 在线模型配置 (可选)")
+        questions = []
+        for var, question, prompt in ONLINE_API_KEYS:
+            confirm_name = f"configure_{var}"
+            questions.append(inquirer.Confirm(confirm_name, message=question, default=False))
+            questions.append(inquirer.Password(
+                var, message=prompt,
+                ignore=lambda answers, name=confirm_name: not answers[name]
+            ))
+        answers = self._prompt(questions)
+        for var, _, _ in ONLINE_API_KEYS:
+            if answers[f"configure_{var}"]:
+                self.env_vars[var] = answers[var] or ""
 
     def _setup_hardware_config(self):
         """设置硬件配置"""
         print("\n🔧 设置硬件配置")
         print("-" * 30)
 
+        if self.inquirer is not None:
+            robot_port, camera_index, mic_index, speaker_index = self._prompt_hardware()
+        else:
+            robot_port, camera_index, mic_index, speaker_index = self._ask_hardware()
+
+        # 硬件配置文件只读取一次，修改后统一保存
+        hardware_config = self.config_manager.load_config('hardware', writable=True)
+        hardware_changed = False
+
         # 机械臂配置
+        if robot_port:
+            self.env_vars['ROBOT_PORT'] = robot_port
+
+        # 摄像头配置
+        if camera_index and camera_index.isdigit():
+            hardware_config['camera']['camera_index'] = int(camera_index)
+            hardware_changed = True
+
+        # 音频设备配置
+        if mic_index and mic_index.isdigit():
+            hardware_config['audio']['input_device_index'] = int(mic_index)
+            hardware_changed = True
+        if speaker_index and speaker_index.isdigit():
+            hardware_config['audio']['output_device_index'] = int(speaker_index)
+            hardware_changed = True
+
+        # 更新硬件配置文件
+        if hardware_changed:
+            self.config_manager.save_config('hardware', hardware_config)
+
+    def _ask_hardware(self):
+        """逐项询问硬件配置
+
+        Returns:
+            (机械臂串口, 摄像头索引, 麦克风索引, 扬声器索引)，未配置的项为None
+        """
+        robot_port = camera_index = mic_index = speaker_index = None
+
         if self._ask_yes_no("是否配置机械臂串口？"):
             robot_port = self._get_input(
                 "请输入机械臂串口地址",
                 default="/dev/ttyUSB0"
             )
-            if robot_port:
-                self.env_vars['ROBOT_PORT'] = robot_port
 
-        # 摄像头配置
         if self._ask_yes_no("是否修改摄像头索引？"):
             camera_index = self._get_input(
                 "请输入摄像头索引号",
                 default="0"
             )
-            if camera_index.isdigit():
-                # 更新硬件配置文件
-                hardware_config = self.config_manager.load_config('hardware')
-                hardware_config['camera']['camera_index'] = int(camera_index)
-                self.config_manager.save_config('hardware', hardware_config)
 
-        # 音频设备配置
         if self._ask_yes_no("是否配置音频设备？"):
             mic_index = self._get_input(
                 "请输入麦克风设备索引号（留空使用默认）"
@@ -155,13 +245,41 @@ class ConfigSetup:
                 "请输入扬声器设备索引号（留空使用默认）"
             )
 
-            if mic_index or speaker_index:
-                hardware_config = self.config_manager.load_config('hardware')
-                if mic_index and mic_index.isdigit():
-                    hardware_config['audio']['input_device_index'] = int(mic_index)
-                if speaker_index and speaker_index.isdigit():
-                    hardware_config['audio']['output_device_index'] = int(speaker_index)
-                self.config_manager.save_config('hardware', hardware_config)
+        return robot_port, camera_index, mic_index, speaker_index
+
+    def _prompt_hardware(self):
+        """使用inquirer一次性询问硬件配置
+
+        Returns:
+            (机械臂串口, 摄像头索引, 麦克风索引, 扬声器索引)，未配置的项为None
+        """
+        inquirer = self.inquirer
+        answers = self._prompt([
+            inquirer.Confirm('configure_robot', message="是否配置机械臂串口？", default=False),
+            inquirer.Text('robot_port', message="请输入机械臂串口地址", default="/dev/ttyUSB0",
+                          ignore=lambda answers: not answers['configure_robot']),
+            inquirer.Confirm('configure_camera', message="是否修改摄像头索引？", default=False),
+            inquirer.Text('camera_index', message="请输入摄像头索引号", default="0",
+                          validate=_optional_index,
+                          ignore=lambda answers: not answers['configure_camera']),
+            inquirer.Confirm('configure_audio', message="是否配置音频设备？", default=False),
+            inquirer.Text('mic_index', message="请输入麦克风设备索引号（留空使用默认）",
+                          validate=_optional_index,
+                          ignore=lambda answers: not answers['configure_audio']),
+            inquirer.Text('speaker_index', message="请输入扬声器设备索引号（留空使用默认）",
+                          validate=_optional_index,
+                          ignore=lambda answers: not answers['configure_audio']),
+        ])
+
+        def answer(name, enabled):
+            return (answers[name] or "").strip() if answers[enabled] else None
+
+        return (
+            answer('robot_port', 'configure_robot'),
+            answer('camera_index', 'configure_camera'),
+            answer('mic_index', 'configure_audio'),
+            answer('speaker_index', 'configure_audio'),
+        )
 
     def _save_configuration(self):
         """保存配置到.env文件"""
@@ -173,45 +291,31 @@ class ConfigSetup:
         # 读取现有.env文件（如果存在）
         existing_vars = {}
         if env_file.exists():
-            with open(env_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        existing_vars[key] = value
+            lines = (line.strip() for line in env_file.read_text(encoding='utf-8').splitlines())
+            existing_vars = dict(
+                line.split('=', 1) for line in lines
+                if line and not line.startswith('#') and '=' in line
+            )
 
         # 合并新的环境变量
         all_vars = {**existing_vars, **self.env_vars}
 
-        # 写入.env文件
-        with open(env_file, 'w', encoding='utf-8') as f:
-            f.write("# Embodied Agent Framework Environment Variables\n")
-            f.write(f"# Generated on {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-            # 分组写入变量
-            groups = {
-                "Private Model Configuration": [
-                    'PRIVATE_API_KEY', 'PRIVATE_BASE_URL',
-                    'PRIVATE_LLM_MODEL', 'PRIVATE_VLM_MODEL'
-                ],
-                "Online Model APIs": [
-                    'YI_KEY', 'QWEN_KEY', 'OPENAI_API_KEY', 'APPBUILDER_TOKEN'
-                ],
-                "Hardware Configuration": [
-                    'ROBOT_PORT'
-                ],
-                "Development Settings": [
-                    'DEBUG', 'LOG_LEVEL'
-                ]
-            }
-
-            for group_name, var_names in groups.items():
-                group_vars = [(name, all_vars.get(name)) for name in var_names if name in all_vars]
-                if group_vars:
-                    f.write(f"# {group_name}\n")
-                    for var_name, var_value in group_vars:
-                        f.write(f"{var_name}={var_value}\n")
-                    f.write("\n")
+        output_lines = [
+            "# Embodied Agent Framework Environment Variables",
+            f"# Generated on {datetime.now().isoformat(sep=' ', timespec='seconds')}",
+            ""
+        ]
+
+        # 分组写入变量
+        for group_name, var_names in ENV_GROUPS:
+            group_lines = [f"{name}={all_vars[name]}" for name in var_names if name in all_vars]
+            if group_lines:
+                output_lines.append(f"# {group_name}")
+                output_lines.extend(group_lines)
+                output_lines.append("")
+
+        # 一次性写入.env文件
+        env_file.write_text("\n".join(output_lines) + "\n", encoding='utf-8')
 
         print(f"✅ 配置已保存到: {env_file}")
 
@@ -219,8 +323,8 @@ class ConfigSetup:
         """验证配置"""
         print("\n🔍 验证配置...")
 
-        # 重新加载配置管理器以读取新的.env文件
-        self.config_manager = ConfigManager()
+        # 重新读取新的.env文件
+        self.config_manager.reload_env()
 
         validation_results = self.config_manager.validate_config()
 
@@ -234,6 +338,10 @@ class ConfigSetup:
         else:
             print("⚠️ 部分配置验证失败，请检查相关设置")
 
+    def _prompt(self, questions) -> Dict[str, Any]:
+        """一次性提出一组inquirer问题"""
+        return self.inquirer.prompt(questions, raise_keyboard_interrupt=True)
+
     def _get_input(self, prompt: str, default: str = "", required: bool = False, secret: bool = False) -> str:
         """获取用户输入"""
         if default:
@@ -284,7 +392,4 @@ def main():
 
 
 if __name__ == "__main__":
-    # 导入需要的模块
-    import time
-
     main()
\ No newline at end of file
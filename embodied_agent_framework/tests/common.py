@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tester Helpers - 硬件测试和模型测试共用的工具
+"""
+
+import asyncio
+import importlib
+import threading
+from types import ModuleType
+from typing import Dict, Optional, Tuple
+from loguru import logger
+
+# 测试状态对应的图标
+STATUS_ICON = {
+    'success': '✅',
+    'failed': '❌',
+    'warning': '⚠️'
+}
+
+# 单次阻塞调用的超时时间（秒），避免设备或接口无响应时卡住整个测试
+CALL_TIMEOUT_S = 30.0
+
+# 原项目模块所在的包
+DEMO_PACKAGE = 'agent_demo_20250328'
+
+
+def try_import(name: str) -> Tuple[Optional[ModuleType], Optional[str]]:
+    """
+    导入可选模块
+
+    原项目的部分模块在导入时就会访问硬件或文件（打开串口、加载字体等），
+    失败时抛出的不是ImportError。这类错误只记录下来，由用到该模块的测试项
+    报告失败，不影响测试器的创建。
+
+    Returns:
+        Tuple[Optional[ModuleType], Optional[str]]: (模块, 导入错误)；
+        模块不存在时两者均为None，导入出错时模块为None
+    """
+    try:
+        return importlib.import_module(name), None
+    except ImportError:
+        return None, None
+    except Exception as e:
+        logger.error(f"❌ 导入 {name} 出错: {e}")
+        return None, str(e)
+
+
+class CallTimeout(Exception):
+    """阻塞调用超时"""
+
+    def __str__(self):
+        return 'timeout'
+
+
+def _set_call_result(future: asyncio.Future, result=None, error: Optional[BaseException] = None):
+    """在事件循环线程中设置 call_blocking 的结果（已超时放弃等待时忽略）"""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+async def call_blocking(func, *args, timeout: Optional[float] = CALL_TIMEOUT_S, **kwargs):
+    """在守护线程中运行阻塞的设备或SDK调用，避免阻塞事件循环
+
+    超时只是不再等待结果，线程中的调用会继续运行，设备或网络连接可能在调用自行返回前
+    一直被占用。使用守护线程而不是默认线程池，是因为 asyncio.run 退出时会等待
+    线程池中的线程，超时的调用会让整个进程卡住。等待用户操作的交互式调用
+    应传入 timeout=None，一直等到调用返回。
+
+    Raises:
+        CallTimeout: 调用超过timeout秒仍未返回
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def run():
+        try:
+            result, error = func(*args, **kwargs), None
+        except BaseException as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(_set_call_result, future, result, error)
+        except RuntimeError:
+            pass  # 事件循环已关闭
+
+    threading.Thread(target=run, daemon=True).start()
+    try:
+        return await asyncio.wait_for(future, timeout=timeout)
+    except asyncio.TimeoutError:
+        raise CallTimeout() from None
+
+
+class DemoModuleMixin:
+    """导入原项目模块，并记录导入出错的模块（子类在 __init__ 中初始化 _import_errors）"""
+
+    _import_errors: Dict[str, str]
+
+    def _import_demo(self, module: str) -> Optional[ModuleType]:
+        """导入原项目的模块，导入出错时记录到 _import_errors"""
+        mod, error = try_import(f'{DEMO_PACKAGE}.{module}')
+        if error is not None:
+            self._import_errors[module] = error
+        return mod
+
+    def _import_failure(self, *modules: str, message: str) -> Optional[dict]:
+        """
+        所需模块导入出错时返回失败结果
+
+        Args:
+            modules: 测试项用到的原项目模块名
+            message: 失败说明，后面会附上导入错误
+
+        Returns:
+            Optional[dict]: 失败结果，模块没有导入错误时返回None
+        """
+        for module in modules:
+            error = self._import_errors.get(module)
+            if error is not None:
+                return {'status': 'failed', 'error': error, 'message': f'{message}: {error}'}
+        return None
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Run All Tests - 同时运行硬件测试和模型连通性测试
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tests.test_hardware import HardwareTester
+from tests.test_models import ModelTester
+
+
+async def main():
+    """主函数"""
+    print("🧪 硬件设备测试 + AI模型连通性测试")
+    print("=" * 50)
+
+    # 创建测试目录
+    Path("tests").mkdir(exist_ok=True)
+
+    # 模型测试只访问网络，硬件测试只访问本地设备，两者互不影响，并发运行
+    # 两份报告分别写入 hardware_test_report.txt 和 model_test_report.txt
+    async with HardwareTester() as hardware_tester, ModelTester() as model_tester:
+        await asyncio.gather(
+            hardware_tester.test_all_hardware(),
+            model_tester.test_all_models()
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
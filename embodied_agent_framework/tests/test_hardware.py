@@ -6,53 +6,147 @@ Hardware Tests - 测试硬件设备连接和功能
 import asyncio
 import sys
 from pathlib import Path
+from typing import Dict
 import time
 from loguru import logger
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from embodied_agent.utils.config import ConfigManager
-
-
-class HardwareTester:
+from embodied_agent.utils.config import get_config_manager
+from tests.common import STATUS_ICON, DemoModuleMixin, call_blocking
+
+# 报告末尾固定的硬件配置建议
+_HARDWARE_FOOTER = (
+    "=" * 60,
+    "硬件配置建议:",
+    "-" * 30,
+    "如果硬件测试失败，请检查以下配置:",
+    "",
+    "1. 机械臂连接:",
+    "   - 确认机械臂已正确连接到电脑",
+    "   - 检查USB/串口连接",
+    "   - 确认机械臂电源已开启",
+    "   - 检查驱动程序是否正确安装",
+    "",
+    "2. 摄像头设置:",
+    "   - 确认摄像头已连接",
+    "   - 检查摄像头权限设置",
+    "   - 确认摄像头索引号正确",
+    "",
+    "3. 音频设备:",
+    "   - 确认麦克风和扬声器已连接",
+    "   - 检查音频设备权限",
+    "   - 确认设备索引号正确",
+    "",
+    "4. GPIO设备（树莓派）:",
+    "   - 确认运行在树莓派环境",
+    "   - 检查GPIO权限（可能需要sudo）",
+    "   - 确认吸泵电路连接正确",
+    "=" * 60,
+)
+
+# 吸泵开启后的保持时间（秒）
+PUMP_DWELL_S = 0.2
+# 等待机械臂停止运动的最长时间和轮询间隔（秒）
+SETTLE_TIMEOUT_S = 5.0
+SETTLE_POLL_S = 0.05
+
+
+class HardwareTester(DemoModuleMixin):
     """硬件设备测试器"""
 
     def __init__(self):
         """初始化测试器"""
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.test_results = {}
+        # 原项目的硬件控制模块只探测一次，缺失的模块在对应测试中给出警告，
+        # 导入出错（如未连接机械臂）的模块在对应测试中报告失败
+        self._import_errors: Dict[str, str] = {}
+        self._robot_mod = self._import_demo('utils_robot')
+        self._camera_mod = self._import_demo('utils_camera')
+        self._asr_mod = self._import_demo('utils_asr')
+        self._tts_mod = self._import_demo('utils_tts')
+        self._pump_mod = self._import_demo('utils_pump')
+        # 俯视拍照也会驱动机械臂，机械臂和摄像头测试不能同时进行
+        self._robot_lock = asyncio.Lock()
+        # 播放测试用的音频文件，存在性只检查一次
+        self._welcome_wav = Path('asset/welcome.wav')
+        self._has_welcome_wav = self._welcome_wav.is_file()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """无论测试是否出错，都关闭吸泵并让机械臂回到原点"""
+        cleanups = []
+        if self._pump_mod is not None:
+            cleanups.append(('pump_off', self._pump_mod.pump_off))
+        if self._robot_mod is not None:
+            cleanups.append(('back_zero', self._robot_mod.back_zero))
+
+        for name, cleanup in cleanups:
+            try:
+                await call_blocking(cleanup)
+            except Exception as e:
+                logger.warning(f"⚠️ 硬件清理失败 ({name}): {e}")
+        return False
 
     async def test_all_hardware(self):
         """测试所有硬件设备"""
         logger.info("🔧 开始测试硬件设备")
 
-        # 测试机械臂
-        await self._test_robot_hardware()
-
-        # 测试摄像头
-        await self._test_camera_hardware()
-
-        # 测试音频设备
-        await self._test_audio_hardware()
-
-        # 测试GPIO和吸泵
-        await self._test_gpio_hardware()
+        # 各硬件设备相互独立，并发测试
+        tests = {
+            'robot': self._with_robot_lock(self._test_robot_hardware()),
+            'camera': self._with_robot_lock(self._test_camera_hardware()),
+            'audio': self._test_audio_hardware(),
+            'gpio': self._test_gpio_hardware(),
+        }
+        results = await asyncio.gather(*tests.values(), return_exceptions=True)
+
+        for hardware_name, result in zip(tests, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ {hardware_name}硬件测试失败: {result}")
+                result = {
+                    'status': 'failed',
+                    'error': str(result),
+                    'message': f'{hardware_name}硬件测试出错'
+                }
+            self.test_results[hardware_name] = result
 
         self._generate_hardware_report()
 
+    async def _with_robot_lock(self, coro):
+        """在持有机械臂锁的情况下运行测试"""
+        async with self._robot_lock:
+            return await coro
+
     async def _test_robot_hardware(self):
         """测试机械臂硬件"""
         logger.info("🤖 测试机械臂硬件...")
 
-        try:
-            # 尝试连接机械臂
-            from agent_demo_20250328.utils_robot import mc, back_zero, move_to_top_view, head_shake
+        robot = self._robot_mod
+        if robot is None:
+            failure = self._import_failure('utils_robot', message='机械臂控制模块导入出错')
+            if failure is not None:
+                return failure
+            result = {
+                'status': 'warning',
+                'message': '找不到机械臂控制模块，可能未正确安装'
+            }
+            logger.warning("⚠️ 找不到机械臂控制模块")
+            return result
 
+        mc = robot.mc
+        try:
             # 测试基本连接
             try:
-                current_angles = mc.get_angles()
-                current_coords = mc.get_coords()
+                # 两次串口查询同时发出，结果只查询一次并在下面复用
+                current_angles, current_coords = await asyncio.gather(
+                    call_blocking(mc.get_angles),
+                    call_blocking(mc.get_coords)
+                )
                 robot_connected = True
                 connection_message = "机械臂连接成功"
             except Exception as e:
@@ -65,28 +159,28 @@ class HardwareTester:
                 try:
                     # 测试归零
                     logger.info("测试归零动作...")
-                    back_zero()
+                    await call_blocking(robot.back_zero)
                     movement_tests['back_zero'] = 'success'
-                    await asyncio.sleep(2)
+                    await self._wait_settled(mc)
 
                     # 测试俯视姿态
                     logger.info("测试俯视姿态...")
-                    move_to_top_view()
+                    await call_blocking(robot.move_to_top_view)
                     movement_tests['top_view'] = 'success'
-                    await asyncio.sleep(3)
+                    await self._wait_settled(mc)
 
                     # 测试摇头动作
                     logger.info("测试摇头动作...")
-                    head_shake()
+                    await call_blocking(robot.head_shake)
                     movement_tests['head_shake'] = 'success'
 
                     logger.info("所有动作测试完成，回到原点...")
-                    back_zero()
+                    await call_blocking(robot.back_zero)
 
                 except Exception as e:
                     movement_tests['error'] = str(e)
 
-            self.test_results['robot'] = {
+            result = {
                 'connected': robot_connected,
                 'connection_message': connection_message,
                 'current_angles': current_angles if robot_connected else None,
@@ -100,33 +194,51 @@ class HardwareTester:
             else:
                 logger.error("❌ 机械臂硬件测试失败")
 
-        except ImportError:
-            self.test_results['robot'] = {
-                'status': 'warning',
-                'message': '找不到机械臂控制模块，可能未正确安装'
-            }
-            logger.warning("⚠️ 找不到机械臂控制模块")
-
         except Exception as e:
-            self.test_results['robot'] = {
+            result = {
                 'status': 'failed',
                 'error': str(e),
                 'message': '机械臂硬件测试出错'
             }
             logger.error(f"❌ 机械臂硬件测试失败: {e}")
 
+        return result
+
+    async def _wait_settled(self, mc, timeout: float = SETTLE_TIMEOUT_S):
+        """等待机械臂运动结束，而不是固定等待
+
+        Args:
+            mc: 机械臂对象（MyCobot）
+            timeout: 最长等待时间（秒），超时后直接继续
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        # is_moving() 返回 1 表示运动中，0 表示已停止，-1 表示出错
+        while loop.time() < deadline and await call_blocking(mc.is_moving) == 1:
+            await asyncio.sleep(SETTLE_POLL_S)
+
     async def _test_camera_hardware(self):
         """测试摄像头硬件"""
         logger.info("📹 测试摄像头硬件...")
 
-        try:
-            from agent_demo_20250328.utils_camera import check_camera
-            from agent_demo_20250328.utils_robot import top_view_shot
+        if self._camera_mod is None or self._robot_mod is None:
+            failure = self._import_failure('utils_camera', 'utils_robot', message='摄像头控制模块导入出错')
+            if failure is not None:
+                return failure
+            result = {
+                'status': 'warning',
+                'message': '找不到摄像头控制模块'
+            }
+            logger.warning("⚠️ 找不到摄像头控制模块")
+            return result
 
+        try:
             # 测试摄像头基本功能
             try:
-                logger.info("测试摄像头基本功能...")
-                check_camera()
+                logger.info("测试摄像头基本功能（在预览窗口中按q键结束）...")
+                # 预览一直运行到用户按q键，不设超时：超时放弃的预览线程会继续占用摄像头，
+                # 随后的俯视拍照就打不开摄像头
+                await call_blocking(self._camera_mod.check_camera, timeout=None)
                 camera_basic = 'success'
                 camera_message = "摄像头基本功能正常"
             except Exception as e:
@@ -136,7 +248,7 @@ class HardwareTester:
             # 测试俯视拍照
             try:
                 logger.info("测试俯视拍照功能...")
-                top_view_shot(check=False)
+                await call_blocking(self._robot_mod.top_view_shot, check=False)
                 top_view_capture = 'success'
 
                 # 检查图片是否生成
@@ -149,7 +261,7 @@ class HardwareTester:
                 top_view_capture = 'failed'
                 photo_saved = False
 
-            self.test_results['camera'] = {
+            result = {
                 'basic_function': camera_basic,
                 'message': camera_message,
                 'top_view_capture': top_view_capture,
@@ -162,30 +274,32 @@ class HardwareTester:
             else:
                 logger.error("❌ 摄像头硬件测试失败")
 
-        except ImportError:
-            self.test_results['camera'] = {
-                'status': 'warning',
-                'message': '找不到摄像头控制模块'
-            }
-            logger.warning("⚠️ 找不到摄像头控制模块")
-
         except Exception as e:
-            self.test_results['camera'] = {
+            result = {
                 'status': 'failed',
                 'error': str(e),
                 'message': '摄像头硬件测试出错'
             }
             logger.error(f"❌ 摄像头硬件测试失败: {e}")
 
+        return result
+
     async def _test_audio_hardware(self):
         """测试音频设备硬件"""
         logger.info("🎙️ 测试音频设备硬件...")
 
-        try:
-            from agent_demo_20250328.utils_asr import record
-            from agent_demo_20250328.utils_tts import play_wav
-            from agent_demo_20250328.sound_check import main as sound_check
+        if self._asr_mod is None or self._tts_mod is None:
+            failure = self._import_failure('utils_asr', 'utils_tts', message='音频控制模块导入出错')
+            if failure is not None:
+                return failure
+            result = {
+                'status': 'warning',
+                'message': '找不到音频控制模块'
+            }
+            logger.warning("⚠️ 找不到音频控制模块")
+            return result
 
+        try:
             # 测试音频设备检测
             try:
                 logger.info("检测音频设备...")
@@ -196,31 +310,27 @@ class HardwareTester:
                 device_check = 'failed'
                 device_message = f"音频设备检测失败: {e}"
 
-            # 测试录音功能
-            try:
-                logger.info("测试录音功能（2秒）...")
-                record(MIC_INDEX=3, DURATION=2)  # 录音2秒
+            # 录音和播放使用不同的设备，同时测试
+            logger.info("测试录音功能（2秒）和音频播放功能...")
+            probes = [call_blocking(self._asr_mod.record, MIC_INDEX=3, DURATION=2)]  # 录音2秒
+            if self._has_welcome_wav:
+                probes.append(call_blocking(self._tts_mod.play_wav, str(self._welcome_wav)))
+            outcomes = await asyncio.gather(*probes, return_exceptions=True)
 
-                # 检查录音文件是否生成
-                if Path('temp/speech_record.wav').exists():
-                    recording_test = 'success'
-                else:
-                    recording_test = 'failed'
-            except Exception as e:
+            # 检查录音文件是否生成
+            if not isinstance(outcomes[0], Exception) and Path('temp/speech_record.wav').exists():
+                recording_test = 'success'
+            else:
                 recording_test = 'failed'
 
-            # 测试播放功能
-            try:
-                logger.info("测试音频播放功能...")
-                if Path('asset/welcome.wav').exists():
-                    play_wav('asset/welcome.wav')
-                    playback_test = 'success'
-                else:
-                    playback_test = 'warning'  # 文件不存在但功能可能正常
-            except Exception as e:
+            if not self._has_welcome_wav:
+                playback_test = 'warning'  # 文件不存在但功能可能正常
+            elif isinstance(outcomes[1], Exception):
                 playback_test = 'failed'
+            else:
+                playback_test = 'success'
 
-            self.test_results['audio'] = {
+            result = {
                 'device_check': device_check,
                 'device_message': device_message,
                 'recording_test': recording_test,
@@ -233,36 +343,40 @@ class HardwareTester:
             else:
                 logger.error("❌ 音频设备硬件测试失败")
 
-        except ImportError:
-            self.test_results['audio'] = {
-                'status': 'warning',
-                'message': '找不到音频控制模块'
-            }
-            logger.warning("⚠️ 找不到音频控制模块")
-
         except Exception as e:
-            self.test_results['audio'] = {
+            result = {
                 'status': 'failed',
                 'error': str(e),
                 'message': '音频设备硬件测试出错'
             }
             logger.error(f"❌ 音频设备硬件测试失败: {e}")
 
+        return result
+
     async def _test_gpio_hardware(self):
         """测试GPIO和吸泵硬件"""
         logger.info("🔌 测试GPIO和吸泵硬件...")
 
-        try:
-            from agent_demo_20250328.utils_pump import pump_on, pump_off
+        if self._pump_mod is None:
+            failure = self._import_failure('utils_pump', message='GPIO控制模块导入出错')
+            if failure is not None:
+                return failure
+            result = {
+                'status': 'warning',
+                'message': '找不到GPIO控制模块，可能不在树莓派环境'
+            }
+            logger.warning("⚠️ 找不到GPIO控制模块")
+            return result
 
+        try:
             # 测试吸泵控制
             try:
                 logger.info("测试吸泵开启...")
-                pump_on()
-                await asyncio.sleep(1)
+                await call_blocking(self._pump_mod.pump_on)
+                await asyncio.sleep(PUMP_DWELL_S)
 
                 logger.info("测试吸泵关闭...")
-                pump_off()
+                await call_blocking(self._pump_mod.pump_off)
 
                 pump_test = 'success'
                 pump_message = "吸泵控制正常"
@@ -271,7 +385,7 @@ class HardwareTester:
                 pump_test = 'failed'
                 pump_message = f"吸泵控制失败: {e}"
 
-            self.test_results['gpio'] = {
+            result = {
                 'pump_test': pump_test,
                 'pump_message': pump_message,
                 'status': pump_test
@@ -282,21 +396,16 @@ class HardwareTester:
             else:
                 logger.error("❌ GPIO和吸泵硬件测试失败")
 
-        except ImportError:
-            self.test_results['gpio'] = {
-                'status': 'warning',
-                'message': '找不到GPIO控制模块，可能不在树莓派环境'
-            }
-            logger.warning("⚠️ 找不到GPIO控制模块")
-
         except Exception as e:
-            self.test_results['gpio'] = {
+            result = {
                 'status': 'failed',
                 'error': str(e),
                 'message': 'GPIO硬件测试出错'
             }
             logger.error(f"❌ GPIO硬件测试失败: {e}")
 
+        return result
+
     def _generate_hardware_report(self):
         """生成硬件测试报告"""
         logger.info("📊 生成硬件测试报告...")
@@ -312,77 +421,44 @@ class HardwareTester:
         ]
 
         for hardware_name, result in self.test_results.items():
-            status_icon = {
-                'success': '✅',
-                'failed': '❌',
-                'warning': '⚠️'
-            }.get(result.get('status'), '❓')
-
-            report_lines.append(f"{status_icon} {hardware_name.upper()}")
+            status_icon = STATUS_ICON.get(result.get('status'), '❓')
+            item_lines = [f"{status_icon} {hardware_name.upper()}"]
 
             if 'message' in result:
-                report_lines.append(f"   状态: {result['message']}")
+                item_lines.append(f"   状态: {result['message']}")
 
             # 添加详细信息
             if hardware_name == 'robot' and result.get('connected'):
                 if result.get('current_angles'):
-                    report_lines.append(f"   当前关节角度: {result['current_angles']}")
-                if result.get('movement_tests'):
-                    for test_name, test_result in result['movement_tests'].items():
-                        test_icon = '✅' if test_result == 'success' else '❌'
-                        report_lines.append(f"   {test_icon} {test_name}")
+                    item_lines.append(f"   当前关节角度: {result['current_angles']}")
+                item_lines.extend(
+                    f"   {'✅' if test_result == 'success' else '❌'} {test_name}"
+                    for test_name, test_result in result.get('movement_tests', {}).items()
+                )
 
             elif hardware_name == 'camera':
                 if result.get('photo_saved'):
-                    report_lines.append("   ✅ 图片保存成功")
+                    item_lines.append("   ✅ 图片保存成功")
 
             elif hardware_name == 'audio':
-                for test_type in ['recording_test', 'playback_test']:
-                    if test_type in result:
-                        test_icon = '✅' if result[test_type] == 'success' else '❌'
-                        report_lines.append(f"   {test_icon} {test_type.replace('_', ' ')}")
+                item_lines.extend(
+                    f"   {'✅' if result[test_type] == 'success' else '❌'} {test_type.replace('_', ' ')}"
+                    for test_type in ('recording_test', 'playback_test') if test_type in result
+                )
 
-            report_lines.append("")  # 空行
-
-        report_lines.extend([
-            "=" * 60,
-            "硬件配置建议:",
-            "-" * 30,
-            "如果硬件测试失败，请检查以下配置:",
-            "",
-            "1. 机械臂连接:",
-            "   - 确认机械臂已正确连接到电脑",
-            "   - 检查USB/串口连接",
-            "   - 确认机械臂电源已开启",
-            "   - 检查驱动程序是否正确安装",
-            "",
-            "2. 摄像头设置:",
-            "   - 确认摄像头已连接",
-            "   - 检查摄像头权限设置",
-            "   - 确认摄像头索引号正确",
-            "",
-            "3. 音频设备:",
-            "   - 确认麦克风和扬声器已连接",
-            "   - 检查音频设备权限",
-            "   - 确认设备索引号正确",
-            "",
-            "4. GPIO设备（树莓派）:",
-            "   - 确认运行在树莓派环境",
-            "   - 检查GPIO权限（可能需要sudo）",
-            "   - 确认吸泵电路连接正确",
-            "=" * 60
-        ])
+            item_lines.append("")  # 空行
+            report_lines.extend(item_lines)
 
-        report_content = "\n".join(report_lines)
+        report_lines.extend(_HARDWARE_FOOTER)
 
-        # 保存到文件
+        # 保存到文件（逐行写入缓冲区，不再拼接整份报告）
         report_file = Path("tests/hardware_test_report.txt")
         report_file.parent.mkdir(exist_ok=True)
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        with open(report_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines(line + "\n" for line in report_lines)
 
         # 输出到控制台
-        print(report_content)
+        sys.stdout.writelines(line + "\n" for line in report_lines)
 
         logger.info(f"📋 硬件测试报告已保存到: {report_file}")
 
@@ -395,9 +471,9 @@ async def main():
     # 创建测试目录
     Path("tests").mkdir(exist_ok=True)
 
-    # 运行测试
-    tester = HardwareTester()
-    await tester.test_all_hardware()
+    # 运行测试（退出时保证关闭吸泵、机械臂归零）
+    async with HardwareTester() as tester:
+        await tester.test_all_hardware()
 
 
 if __name__ == "__main__":
@@ -4,38 +4,142 @@ Model Connectivity Tests - 测试各种AI模型的连通性
 """
 
 import asyncio
+import base64
+import functools
+import inspect
+import io
 import sys
+import threading
 from pathlib import Path
-import json
+from typing import Dict, Optional
 import time
 from loguru import logger
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from embodied_agent.utils.config import ConfigManager
-
-
-class ModelTester:
+from embodied_agent.utils.config import get_config_manager
+from tests.common import STATUS_ICON, DemoModuleMixin, call_blocking
+
+try:
+    from PIL import Image, ImageDraw
+    PIL_AVAILABLE = True
+except ImportError:
+    logger.warning("PIL not available, test image for VLM tests cannot be generated")
+    PIL_AVAILABLE = False
+
+# 报告末尾固定的配置建议
+_MODEL_FOOTER = (
+    "",
+    "=" * 60,
+    "配置建议:",
+    "-" * 30,
+    "如果测试失败，请检查以下配置:",
+    "",
+    "1. 环境变量配置 (.env 文件):",
+    "   - PRIVATE_API_KEY=你的私有模型API密钥",
+    "   - PRIVATE_BASE_URL=你的私有模型服务地址",
+    "   - PRIVATE_LLM_MODEL=你的文本模型名称",
+    "   - PRIVATE_VLM_MODEL=你的视觉模型名称",
+    "   - YI_KEY=零一万物API密钥",
+    "   - QWEN_KEY=通义千问API密钥",
+    "   - APPBUILDER_TOKEN=百度AppBuilder密钥",
+    "",
+    "2. 网络连接:",
+    "   - 确保可以访问相应的API服务",
+    "   - 检查防火墙和代理设置",
+    "",
+    "3. API配额:",
+    "   - 确认API密钥有足够的调用配额",
+    "   - 检查是否有调用频率限制",
+    "=" * 60,
+)
+
+# 每个模型服务商同时进行的最大请求数，避免触发接口限流
+API_CONCURRENCY = 2
+
+# 按服务商限制并发请求数，所有测试器共用。使用线程信号量并由工作线程持有，
+# 超时放弃等待的请求在线程结束前一直占用名额
+_API_LIMITS = {
+    vendor: threading.BoundedSemaphore(API_CONCURRENCY)
+    for vendor in ('private', 'yi', 'qwen', 'appbuilder')
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _accepts_img_b64(api) -> bool:
+    """视觉模型接口是否支持直接传入base64图片（img_b64参数）"""
+    try:
+        return 'img_b64' in inspect.signature(api).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _call_limited(limit: threading.BoundedSemaphore, func, *args, **kwargs):
+    """持有服务商的并发名额调用接口（在工作线程中运行）"""
+    with limit:
+        return func(*args, **kwargs)
+
+
+def _probe_status(outcome, success_message: str):
+    """把gather(return_exceptions=True)的结果转换为(状态, 消息)"""
+    if isinstance(outcome, Exception):
+        return 'failed', str(outcome)
+    return 'success', success_message
+
+
+class ModelTester(DemoModuleMixin):
     """AI模型连通性测试器"""
 
     def __init__(self):
         """初始化测试器"""
-        self.config_manager = ConfigManager()
+        self.config_manager = get_config_manager()
         self.test_results = {}
+        # 原项目的模型调用模块只探测一次，缺失的函数在对应测试中给出警告，
+        # 导入出错（如缺少字体文件）的模块在对应测试中报告失败
+        self._import_errors: Dict[str, str] = {}
+        self._llm_mod = self._import_demo('utils_llm')
+        self._vlm_mod = self._import_demo('utils_vlm')
+        self._asr_mod = self._import_demo('utils_asr')
+        self._tts_mod = self._import_demo('utils_tts')
+        # 测试素材的路径和存在性只解析一次
+        self._test_image = Path('tests/test_image.jpg')
+        self._test_image_bytes: Optional[bytes] = None
+        self._test_image_b64: Optional[str] = None
+        self._test_image_lock = asyncio.Lock()
+        self._test_audio = Path('tests/test_audio.wav')
+        self._has_test_audio = self._test_audio.is_file()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """模型测试不占用本地设备，无需清理"""
+        return False
 
     async def test_all_models(self):
         """测试所有模型连通性"""
         logger.info("🧠 开始测试AI模型连通性")
 
-        # 测试私有化模型
-        await self._test_private_llm()
-        await self._test_private_vlm()
-
-        # 测试在线模型
-        await self._test_yi_models()
-        await self._test_qwen_models()
-        await self._test_appbuilder_models()
+        # 各模型服务相互独立，并发测试（私有化模型 + 在线模型）
+        tests = {
+            'private_llm': self._test_private_llm(),
+            'private_vlm': self._test_private_vlm(),
+            'yi_models': self._test_yi_models(),
+            'qwen_vlm': self._test_qwen_models(),
+            'appbuilder': self._test_appbuilder_models(),
+        }
+        results = await asyncio.gather(*tests.values(), return_exceptions=True)
+
+        for model_name, result in zip(tests, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ {model_name}测试失败: {result}")
+                result = {
+                    'status': 'failed',
+                    'error': str(result),
+                    'message': f'{model_name}测试出错'
+                }
+            self.test_results[model_name] = result
 
         self._generate_model_report()
 
@@ -43,224 +147,247 @@ class ModelTester:
         """测试私有化部署的文本模型"""
         logger.info("🔧 测试私有化文本模型...")
 
-        try:
-            # 从原项目导入测试函数
-            from agent_demo_20250328.utils_llm import test_private_llm
+        test_private_llm = getattr(self._llm_mod, 'test_private_llm', None)
+        if test_private_llm is None:
+            failure = self._import_failure('utils_llm', message='私有化文本模型模块导入出错')
+            if failure is not None:
+                return failure
+            result = {
+                'status': 'warning',
+                'message': '找不到原项目的测试函数，请手动测试'
+            }
+            logger.warning("⚠️ 找不到原项目的测试函数")
+            return result
 
+        try:
             # 测试连通性
-            response = test_private_llm("你好，请简单回复确认连接正常")
+            response = await self._call_api('private', test_private_llm, "你好，请简单回复确认连接正常")
 
-            self.test_results['private_llm'] = {
+            result = {
                 'status': 'success',
                 'response': response,
                 'message': '私有化文本模型连接正常'
             }
             logger.success("✅ 私有化文本模型测试通过")
 
-        except ImportError:
-            self.test_results['private_llm'] = {
-                'status': 'warning',
-                'message': '找不到原项目的测试函数，请手动测试'
-            }
-            logger.warning("⚠️ 找不到原项目的测试函数")
-
         except Exception as e:
-            self.test_results['private_llm'] = {
+            result = {
                 'status': 'failed',
                 'error': str(e),
                 'message': '私有化文本模型连接失败'
             }
             logger.error(f"❌ 私有化文本模型测试失败: {e}")
 
+        return result
+
     async def _test_private_vlm(self):
         """测试私有化部署的视觉模型"""
         logger.info("👁️ 测试私有化视觉模型...")
 
-        try:
-            # 从原项目导入测试函数
-            from agent_demo_20250328.utils_vlm import private_vlm_api
-
-            # 创建测试图片（如果不存在）
-            test_image_path = 'tests/test_image.jpg'
-            if not Path(test_image_path).exists():
-                self._create_test_image(test_image_path)
+        private_vlm_api = getattr(self._vlm_mod, 'private_vlm_api', None)
+        if private_vlm_api is None:
+            failure = self._import_failure('utils_vlm', message='私有化视觉模型模块导入出错')
+            if failure is not None:
+                return failure
+            result = {
+                'status': 'warning',
+                'message': '找不到原项目的测试函数，请手动测试'
+            }
+            logger.warning("⚠️ 找不到原项目的测试函数")
+            return result
 
+        try:
             # 测试视觉问答
-            response = private_vlm_api(
-                PROMPT="请描述这张图片中的内容",
-                img_path=test_image_path,
-                vlm_option=1  # VQA模式
-            )
+            response = await self._call_vlm('private', private_vlm_api, "请描述这张图片中的内容")
 
-            self.test_results['private_vlm'] = {
+            result = {
                 'status': 'success',
                 'response': response,
                 'message': '私有化视觉模型连接正常'
             }
             logger.success("✅ 私有化视觉模型测试通过")
 
-        except ImportError:
-            self.test_results['private_vlm'] = {
-                'status': 'warning',
-                'message': '找不到原项目的测试函数，请手动测试'
-            }
-            logger.warning("⚠️ 找不到原项目的测试函数")
-
         except Exception as e:
-            self.test_results['private_vlm'] = {
+            result = {
                 'status': 'failed',
                 'error': str(e),
                 'message': '私有化视觉模型连接失败'
             }
             logger.error(f"❌ 私有化视觉模型测试失败: {e}")
 
+        return result
+
     async def _test_yi_models(self):
         """测试零一万物模型"""
         logger.info("🌟 测试零一万物模型...")
 
-        try:
-            from agent_demo_20250328.utils_llm import llm_yi
-            from agent_demo_20250328.utils_vlm import yi_vision_api
-
-            # 测试文本模型
-            try:
-                messages = [{"role": "user", "content": "你好，请简单回复确认连接正常"}]
-                llm_response = llm_yi(messages)
-                yi_llm_status = 'success'
-                yi_llm_message = '连接正常'
-            except Exception as e:
-                yi_llm_status = 'failed'
-                yi_llm_message = str(e)
-
-            # 测试视觉模型
-            try:
-                test_image_path = 'tests/test_image.jpg'
-                if not Path(test_image_path).exists():
-                    self._create_test_image(test_image_path)
-
-                vlm_response = yi_vision_api(
-                    PROMPT="请描述这张图片",
-                    img_path=test_image_path,
-                    vlm_option=1
-                )
-                yi_vlm_status = 'success'
-                yi_vlm_message = '连接正常'
-            except Exception as e:
-                yi_vlm_status = 'failed'
-                yi_vlm_message = str(e)
-
-            self.test_results['yi_models'] = {
-                'llm': {'status': yi_llm_status, 'message': yi_llm_message},
-                'vlm': {'status': yi_vlm_status, 'message': yi_vlm_message}
-            }
-
-            if yi_llm_status == 'success' and yi_vlm_status == 'success':
-                logger.success("✅ 零一万物模型测试通过")
-            else:
-                logger.warning("⚠️ 零一万物模型部分测试失败")
-
-        except ImportError:
-            self.test_results['yi_models'] = {
+        llm_yi = getattr(self._llm_mod, 'llm_yi', None)
+        yi_vision_api = getattr(self._vlm_mod, 'yi_vision_api', None)
+        if llm_yi is None or yi_vision_api is None:
+            failure = self._import_failure('utils_llm', 'utils_vlm', message='零一万物模型模块导入出错')
+            if failure is not None:
+                return failure
+            result = {
                 'status': 'warning',
                 'message': '找不到原项目的测试函数'
             }
             logger.warning("⚠️ 找不到零一万物模型测试函数")
+            return result
+
+        # 文本模型和视觉模型是独立的接口，同时测试
+        messages = [{"role": "user", "content": "你好，请简单回复确认连接正常"}]
+        llm_outcome, vlm_outcome = await asyncio.gather(
+            self._call_api('yi', llm_yi, messages),
+            self._call_vlm('yi', yi_vision_api, "请描述这张图片"),
+            return_exceptions=True
+        )
+        yi_llm_status, yi_llm_message = _probe_status(llm_outcome, '连接正常')
+        yi_vlm_status, yi_vlm_message = _probe_status(vlm_outcome, '连接正常')
+
+        result = {
+            'llm': {'status': yi_llm_status, 'message': yi_llm_message},
+            'vlm': {'status': yi_vlm_status, 'message': yi_vlm_message}
+        }
+
+        if yi_llm_status == 'success' and yi_vlm_status == 'success':
+            logger.success("✅ 零一万物模型测试通过")
+        else:
+            logger.warning("⚠️ 零一万物模型部分测试失败")
+
+        return result
 
     async def _test_qwen_models(self):
         """测试通义千问模型"""
         logger.info("🚀 测试通义千问模型...")
 
-        try:
-            from agent_demo_20250328.utils_vlm import QwenVL_api
+        QwenVL_api = getattr(self._vlm_mod, 'QwenVL_api', None)
+        if QwenVL_api is None:
+            failure = self._import_failure('utils_vlm', message='通义千问模型模块导入出错')
+            if failure is not None:
+                return failure
+            result = {
+                'status': 'warning',
+                'message': '找不到原项目的测试函数'
+            }
+            logger.warning("⚠️ 找不到通义千问模型测试函数")
+            return result
 
+        try:
             # 测试视觉模型
-            test_image_path = 'tests/test_image.jpg'
-            if not Path(test_image_path).exists():
-                self._create_test_image(test_image_path)
-
-            response = QwenVL_api(
-                PROMPT="请描述这张图片",
-                img_path=test_image_path,
-                vlm_option=1
-            )
+            response = await self._call_vlm('qwen', QwenVL_api, "请描述这张图片")
 
-            self.test_results['qwen_vlm'] = {
+            result = {
                 'status': 'success',
                 'response': response,
                 'message': '通义千问视觉模型连接正常'
             }
             logger.success("✅ 通义千问模型测试通过")
 
-        except ImportError:
-            self.test_results['qwen_vlm'] = {
-                'status': 'warning',
-                'message': '找不到原项目的测试函数'
-            }
-            logger.warning("⚠️ 找不到通义千问模型测试函数")
-
         except Exception as e:
-            self.test_results['qwen_vlm'] = {
+            result = {
                 'status': 'failed',
                 'error': str(e),
                 'message': '通义千问模型连接失败'
             }
             logger.error(f"❌ 通义千问模型测试失败: {e}")
 
+        return result
+
     async def _test_appbuilder_models(self):
         """测试AppBuilder模型（TTS/ASR）"""
         logger.info("🎙️ 测试AppBuilder模型...")
 
-        try:
-            from agent_demo_20250328.utils_asr import speech_recognition
-            from agent_demo_20250328.utils_tts import tts
-
-            # 测试TTS
-            try:
-                tts("这是一个测试")
-                tts_status = 'success'
-                tts_message = 'TTS功能正常'
-            except Exception as e:
-                tts_status = 'failed'
-                tts_message = str(e)
-
-            # 测试ASR（需要音频文件）
-            try:
-                # 这里需要有测试音频文件
-                test_audio = 'tests/test_audio.wav'
-                if Path(test_audio).exists():
-                    result = speech_recognition(test_audio)
-                    asr_status = 'success'
-                    asr_message = 'ASR功能正常'
-                else:
-                    asr_status = 'warning'
-                    asr_message = '没有测试音频文件'
-            except Exception as e:
-                asr_status = 'failed'
-                asr_message = str(e)
-
-            self.test_results['appbuilder'] = {
-                'tts': {'status': tts_status, 'message': tts_message},
-                'asr': {'status': asr_status, 'message': asr_message}
-            }
-
-            if tts_status == 'success':
-                logger.success("✅ AppBuilder TTS测试通过")
-            if asr_status == 'success':
-                logger.success("✅ AppBuilder ASR测试通过")
-
-        except ImportError:
-            self.test_results['appbuilder'] = {
+        tts = getattr(self._tts_mod, 'tts', None)
+        speech_recognition = getattr(self._asr_mod, 'speech_recognition', None)
+        if tts is None or speech_recognition is None:
+            failure = self._import_failure('utils_tts', 'utils_asr', message='AppBuilder模块导入出错')
+            if failure is not None:
+                return failure
+            result = {
                 'status': 'warning',
                 'message': '找不到原项目的TTS/ASR函数'
             }
             logger.warning("⚠️ 找不到AppBuilder模型测试函数")
+            return result
+
+        # 测试TTS，同时测试ASR（需要测试音频文件）
+        probes = [self._call_api('appbuilder', tts, "这是一个测试")]
+        if self._has_test_audio:
+            probes.append(self._call_api('appbuilder', speech_recognition, str(self._test_audio)))
+        outcomes = await asyncio.gather(*probes, return_exceptions=True)
+
+        tts_status, tts_message = _probe_status(outcomes[0], 'TTS功能正常')
+        if self._has_test_audio:
+            asr_status, asr_message = _probe_status(outcomes[1], 'ASR功能正常')
+        else:
+            asr_status = 'warning'
+            asr_message = '没有测试音频文件'
+
+        result = {
+            'tts': {'status': tts_status, 'message': tts_message},
+            'asr': {'status': asr_status, 'message': asr_message}
+        }
+
+        if tts_status == 'success':
+            logger.success("✅ AppBuilder TTS测试通过")
+        if asr_status == 'success':
+            logger.success("✅ AppBuilder ASR测试通过")
+
+        return result
+
+    async def _call_api(self, vendor: str, func, *args, **kwargs):
+        """调用模型接口，同一服务商的并发请求数受 _API_LIMITS 限制
+
+        等待名额的时间也计入调用超时。
+
+        Args:
+            vendor: 服务商（private/yi/qwen/appbuilder）
+            func: 原项目的接口函数
+        """
+        return await call_blocking(_call_limited, _API_LIMITS[vendor], func, *args, **kwargs)
+
+    async def _call_vlm(self, vendor: str, api, prompt: str):
+        """以VQA模式调用视觉模型接口
+
+        接口支持img_b64参数时直接传入预编码的测试图片，否则传入图片路径。
+
+        Args:
+            vendor: 服务商（private/yi/qwen）
+            api: 原项目的视觉模型接口函数
+            prompt: 提问内容
+
+        Returns:
+            接口的返回结果
+        """
+        await self._ensure_test_image()
+
+        kwargs = {'PROMPT': prompt, 'vlm_option': 1}
+        if self._test_image_b64 is not None and _accepts_img_b64(api):
+            kwargs['img_b64'] = self._test_image_b64
+        else:
+            kwargs['img_path'] = str(self._test_image)
+        return await self._call_api(vendor, api, **kwargs)
+
+    async def _ensure_test_image(self):
+        """确保测试图片已准备好，并发的视觉模型测试只会创建一次"""
+        async with self._test_image_lock:
+            if self._test_image_bytes is None:
+                await call_blocking(self._create_test_image)
+            if self._test_image_bytes is not None and self._test_image_b64 is None:
+                self._test_image_b64 = base64.b64encode(self._test_image_bytes).decode('ascii')
+
+    def _create_test_image(self):
+        """创建测试图片（已存在时直接读取），内容保存到 _test_image_bytes"""
+        image_file = self._test_image
+        if image_file.is_file():
+            self._test_image_bytes = image_file.read_bytes()
+            return
+
+        if not PIL_AVAILABLE:
+            logger.error("创建测试图片失败: 未安装PIL")
+            return
 
-    def _create_test_image(self, image_path: str):
-        """创建测试图片"""
         try:
-            from PIL import Image, ImageDraw
-            import numpy as np
-
             # 创建一个简单的测试图片
             img = Image.new('RGB', (640, 480), color='white')
             draw = ImageDraw.Draw(img)
@@ -270,10 +397,14 @@ class ModelTester:
             draw.rectangle([300, 200, 400, 300], fill='green', outline='black')
             draw.rectangle([150, 300, 250, 400], fill='blue', outline='black')
 
-            # 保存图片
-            Path(image_path).parent.mkdir(exist_ok=True)
-            img.save(image_path)
-            logger.info(f"创建测试图片: {image_path}")
+            # 编码一次，内存和磁盘各保留一份
+            buf = io.BytesIO()
+            img.save(buf, format='JPEG')
+            self._test_image_bytes = buf.getvalue()
+
+            image_file.parent.mkdir(exist_ok=True)
+            image_file.write_bytes(self._test_image_bytes)
+            logger.info(f"创建测试图片: {image_file}")
 
         except Exception as e:
             logger.error(f"创建测试图片失败: {e}")
@@ -294,60 +425,27 @@ class ModelTester:
 
         for model_name, result in self.test_results.items():
             if isinstance(result, dict) and 'status' in result:
-                status_icon = {
-                    'success': '✅',
-                    'failed': '❌',
-                    'warning': '⚠️'
-                }.get(result['status'], '❓')
+                status_icon = STATUS_ICON.get(result['status'], '❓')
                 report_lines.append(f"{status_icon} {model_name}: {result['message']}")
             else:
                 # 处理复合结果（如yi_models）
                 report_lines.append(f"📋 {model_name}:")
-                for sub_model, sub_result in result.items():
-                    if isinstance(sub_result, dict) and 'status' in sub_result:
-                        status_icon = {
-                            'success': '✅',
-                            'failed': '❌',
-                            'warning': '⚠️'
-                        }.get(sub_result['status'], '❓')
-                        report_lines.append(f"  {status_icon} {sub_model}: {sub_result['message']}")
-
-        report_lines.extend([
-            "",
-            "=" * 60,
-            "配置建议:",
-            "-" * 30,
-            "如果测试失败，请检查以下配置:",
-            "",
-            "1. 环境变量配置 (.env 文件):",
-            "   - PRIVATE_API_KEY=你的私有模型API密钥",
-            "   - PRIVATE_BASE_URL=你的私有模型服务地址",
-            "   - PRIVATE_LLM_MODEL=你的文本模型名称",
-            "   - PRIVATE_VLM_MODEL=你的视觉模型名称",
-            "   - YI_KEY=零一万物API密钥",
-            "   - QWEN_KEY=通义千问API密钥",
-            "   - APPBUILDER_TOKEN=百度AppBuilder密钥",
-            "",
-            "2. 网络连接:",
-            "   - 确保可以访问相应的API服务",
-            "   - 检查防火墙和代理设置",
-            "",
-            "3. API配额:",
-            "   - 确认API密钥有足够的调用配额",
-            "   - 检查是否有调用频率限制",
-            "=" * 60
-        ])
+                report_lines.extend(
+                    f"  {STATUS_ICON.get(sub_result['status'], '❓')} {sub_model}: {sub_result['message']}"
+                    for sub_model, sub_result in result.items()
+                    if isinstance(sub_result, dict) and 'status' in sub_result
+                )
 
-        report_content = "\n".join(report_lines)
+        report_lines.extend(_MODEL_FOOTER)
 
-        # 保存到文件
+        # 保存到文件（逐行写入缓冲区，不再拼接整份报告）
         report_file = Path("tests/model_test_report.txt")
         report_file.parent.mkdir(exist_ok=True)
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        with open(report_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.writelines(line + "\n" for line in report_lines)
 
         # 输出到控制台
-        print(report_content)
+        sys.stdout.writelines(line + "\n" for line in report_lines)
 
         logger.info(f"📋 模型测试报告已保存到: {report_file}")
 
@@ -361,8 +459,8 @@ async def main():
     Path("tests").mkdir(exist_ok=True)
 
     # 运行测试
-    tester = ModelTester()
-    await tester.test_all_models()
+    async with ModelTester() as tester:
+        await tester.test_all_models()
 
 
 if __name__ == "__main__":